@@ -16,6 +16,7 @@ import subprocess
 import threading
 import urllib.request
 import urllib.parse
+from typing import NamedTuple
 
 # 1 second of 44100 Hz stereo 16-bit PCM — used by radio stream feeder
 _STREAM_CHUNK = 44100 * 2 * 2
@@ -27,7 +28,15 @@ from mutagen.wave import WAVE
 from mutagen.flac import FLAC
 from mutagen.aac import AAC
 from mutagen.id3 import ID3, APIC
-from PIL import Image
+
+
+class TrackInfo(NamedTuple):
+    """What the UI needs to render a track that just started playing.
+    Tags are left to the caller, which may already have them cached."""
+    index: int
+    path: str
+    filename: str
+
 
 class AudioPlayer:
     def __init__(self):
@@ -227,42 +236,36 @@ class AudioPlayer:
             print(f"Error reading metadata for {file_path}: {e}")
         return meta
 
-    def get_album_art(self, file_path):
-        """Extract album art from audio file, returns PIL Image or None"""
+    def get_album_art_data(self, file_path):
+        """Extract the raw embedded album-art bytes from an audio file, or None"""
         if not os.path.exists(file_path):
             return None
-            
+
         try:
             file_ext = os.path.splitext(file_path)[1].lower()
-            
+
             if file_ext == '.mp3':
                 audio = ID3(file_path)
                 for tag in audio.values():
                     if isinstance(tag, APIC):
                         # APIC is album art
-                        image_data = tag.data
-                        image = Image.open(io.BytesIO(image_data))
-                        return image
-                        
+                        return tag.data
+
             elif file_ext in ['.m4a', '.mp4']:
                 audio = MP4(file_path)
                 if 'covr' in audio:
-                    image_data = audio['covr'][0]
-                    image = Image.open(io.BytesIO(image_data))
-                    return image
-                    
+                    return audio['covr'][0]
+
             elif file_ext == '.flac':
                 audio = FLAC(file_path)
                 if audio.pictures:
-                    image_data = audio.pictures[0].data
-                    image = Image.open(io.BytesIO(image_data))
-                    return image
-                    
+                    return audio.pictures[0].data
+
         except Exception as e:
             print(f"Error extracting album art: {e}")
-            
+
         return None
-    
+
     def load_folder(self, folder_path):
         """Load all supported audio files from a folder into playlist"""
         if not os.path.exists(folder_path):
@@ -375,12 +378,14 @@ class AudioPlayer:
         print(f"Playlist now has {len(self.playlist)} tracks")
     
     def play_track_at_index(self, index):
-        """Play a specific track from the playlist"""
+        """Play a specific track from the playlist.
+        Returns a TrackInfo for the new track, or None if it couldn't play."""
         if 0 <= index < len(self.playlist):
             self.current_track_index = index
-            if self.load_file(self.playlist[index]):
-                return self.play()
-        return False
+            path = self.playlist[index]
+            if self.load_file(path) and self.play():
+                return TrackInfo(index, path, os.path.basename(path))
+        return None
     
     def _build_shuffle_order(self):
         """Generate a shuffled play order, excluding the current track"""
@@ -404,9 +409,10 @@ class AudioPlayer:
         return self.repeat_mode
 
     def play_next(self):
-        """Play the next track, respecting shuffle and repeat modes"""
+        """Play the next track, respecting shuffle and repeat modes.
+        Returns a TrackInfo, or None if there is nothing to play next."""
         if not self.playlist:
-            return False
+            return None
 
         if self.repeat_mode == 2:  # repeat-one
             return self.play_track_at_index(self.current_track_index)
@@ -419,28 +425,29 @@ class AudioPlayer:
                 self._build_shuffle_order()
                 if self._shuffle_order:
                     return self.play_track_at_index(self._shuffle_order[0])
-            return False
+            return None
         else:
             if self.current_track_index < len(self.playlist) - 1:
                 return self.play_track_at_index(self.current_track_index + 1)
             elif self.repeat_mode == 1:  # repeat-all: wrap to start
                 return self.play_track_at_index(0)
-            return False
+            return None
 
     def play_previous(self):
-        """Play the previous track, respecting shuffle mode"""
+        """Play the previous track, respecting shuffle mode.
+        Returns a TrackInfo, or None if there is no previous track."""
         if not self.playlist:
-            return False
+            return None
 
         if self.shuffle:
             if self._shuffle_pos > 0:
                 self._shuffle_pos -= 1
                 return self.play_track_at_index(self._shuffle_order[self._shuffle_pos])
-            return False
+            return None
         else:
             if self.current_track_index > 0:
                 return self.play_track_at_index(self.current_track_index - 1)
-            return False
+            return None
     
     def play(self):
         """Play the loaded audio file or resume if paused"""
@@ -609,7 +616,11 @@ class AudioPlayer:
             self._stream_channel.set_volume(volume)
     
     def fetch_album_art_online(self, artist='', album='', title=''):
-        """Search iTunes for album art. Returns a PIL Image or None."""
+        """Search iTunes for album art.
+
+        Returns the raw encoded image bytes, or None. Callers decode them
+        for display and can embed them without re-encoding.
+        """
         query = ' '.join(filter(None, [artist, album, title]))
         if not query.strip():
             return None
@@ -624,7 +635,8 @@ class AudioPlayer:
                 if art_url:
                     art_url = art_url.replace('100x100bb', '600x600bb')
                     with urllib.request.urlopen(art_url, timeout=8) as r:
-                        return Image.open(io.BytesIO(r.read())).copy()
+                        raw = r.read()
+                    return raw
         except Exception as e:
             print(f"Error fetching online art: {e}")
         return None
@@ -830,7 +842,8 @@ class AudioPlayer:
         starting at pos_seconds.  Returns list of floats 0.0–1.0, or [].
         Thread-safe (read-only access to _pcm_data).
         """
-        import struct as _struct
+        import sys as _sys
+        from array import array as _array
         if not self._pcm_data:
             return []
         RATE, CH, W = 44100, 2, 2       # sample rate, channels, width bytes
@@ -846,19 +859,21 @@ class AudioPlayer:
         if n_frames == 0:
             return []
 
-        # Unpack interleaved int16; keep left channel only
-        try:
-            all_s = _struct.unpack_from(f'<{n_frames * CH}h', raw)
-        except _struct.error:
-            return []
+        # Unpack interleaved little-endian int16 straight into a C array;
+        # keep left channel only
+        all_s = _array('h')
+        all_s.frombytes(raw[:n_frames * BPF])
+        if _sys.byteorder == 'big':
+            all_s.byteswap()
         left = all_s[::CH]
 
-        # Split into n_bars chunks → mean absolute value per chunk
+        # Split into n_bars chunks → mean absolute value per chunk.
+        # sum(map(abs, ...)) keeps the per-sample loop in C.
         chunk = max(1, len(left) // n_bars)
         bars = []
         for i in range(n_bars):
             sl = left[i * chunk: (i + 1) * chunk]
-            bars.append(sum(abs(s) for s in sl) / len(sl) if sl else 0.0)
+            bars.append(sum(map(abs, sl)) / len(sl) if sl else 0.0)
 
         peak = max(bars) if bars else 0
         if peak == 0:
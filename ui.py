@@ -6,45 +6,99 @@ lepeplabs_audio_thing / Windows 95 retro style with track list and album art
 
 import os
 import io
+import bisect
 import json
+import stat
+import hashlib
+import functools
 import threading
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QLabel, QPushButton, QSlider, QLineEdit,
-    QScrollArea, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame,
-    QFileDialog, QInputDialog, QSizePolicy, QApplication,
+    QVBoxLayout, QHBoxLayout, QGridLayout, QFrame,
+    QFileDialog, QInputDialog, QListView, QStyledItemDelegate,
 )
 from PySide6.QtGui import (
-    QAction, QPixmap, QImage, QPainter, QColor, QFont,
+    QAction, QPixmap, QPixmapCache, QImage, QImageReader, QPainter, QColor, QBrush,
+    QPen, QFont, QFontMetrics,
     QKeySequence, QShortcut,
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QSize, QRect, QLine, QAbstractListModel, QModelIndex,
+    QBuffer, QByteArray, QIODevice, QEvent,
+)
 
-from PIL import Image
+# PIL is imported lazily — it is only needed to re-encode non-JPEG art when
+# saving it to tags, so keep it off the startup import path.
 
 CONFIG_PATH = os.path.expanduser("~/.lepeplabs_player.json")
+# Tags and durations from previous runs, keyed by path and checked against mtime
+META_CACHE_PATH = os.path.expanduser("~/.lepeplabs_player_meta.json")
+
+# Audio extensions accepted by drag-and-drop (lowercase, no leading dot)
+_SUPPORTED_EXTS = frozenset({'mp3', 'm4a', 'mp4', 'aac', 'wma', 'wav', 'flac'})
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _pil_to_qpixmap(img: Image.Image) -> QPixmap:
-    """Convert a PIL Image to QPixmap via PNG bytes."""
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    qimg = QImage()
-    qimg.loadFromData(buf.read())
-    return QPixmap.fromImage(qimg)
+def _art_qimage(data: bytes) -> QImage | None:
+    """Decode cover bytes straight to a QImage that fits 280×280.
+
+    QImageReader hands the target size to the codec, so JPEGs are decoded
+    at a reduced DCT scale much like PIL's draft(). QImage, unlike QPixmap,
+    is safe to build on a worker thread.
+    """
+    buf = QBuffer()
+    buf.setData(QByteArray(data))
+    buf.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buf)
+    size = reader.size()
+    if size.isValid() and (size.width() > 280 or size.height() > 280):
+        reader.setScaledSize(size.scaled(280, 280, Qt.AspectRatioMode.KeepAspectRatio))
+    img = reader.read()
+    if img.isNull():
+        print(f"Error decoding album art: {reader.errorString()}")
+        return None
+    return img
+
+
+def _image_mime(data: bytes) -> str | None:
+    """Sniff the MIME type of encoded image bytes from their magic number."""
+    if data[:3] == b'\xff\xd8\xff':
+        return 'image/jpeg'
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'image/png'
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _short_name(name: str) -> str:
+    """Truncate a filename to fit the 35-column LCD song display."""
+    return name if len(name) <= 35 else name[:32] + "..."
+
+
+_FONT_CACHE: dict = {}
+
+
+def _font(family: str, size: int, bold: bool = False) -> QFont:
+    """Return a shared QFont for (family, size, bold), built on first use."""
+    key = (family, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        weight = QFont.Weight.Bold if bold else QFont.Weight.Normal
+        font = _FONT_CACHE[key] = QFont(family, size, weight)
+    return font
 
 
 def _lcd_label(parent, text, font_size=10, bold=True) -> QLabel:
-    """Create a green-on-black monospaced label for the LCD area."""
+    """Create a monospaced label for the LCD area. Its green-on-black colours
+    come from the window stylesheet's lcdPanel rule."""
     lbl = QLabel(text, parent)
-    weight = QFont.Weight.Bold if bold else QFont.Weight.Normal
-    lbl.setFont(QFont("Courier", font_size, weight))
-    lbl.setStyleSheet("color: #00FF00; background: #000000;")
+    lbl.setFont(_font("Courier", font_size, bold))
     return lbl
 
 
@@ -52,7 +106,7 @@ def _win95_btn(text, parent=None, width=50, height=35, font_size=14) -> QPushBut
     """Create a Win95-style push button."""
     btn = QPushButton(text, parent)
     btn.setFixedSize(width, height)
-    btn.setFont(QFont("Arial", font_size, QFont.Weight.Bold))
+    btn.setFont(_font("Arial", font_size, True))
     return btn
 
 
@@ -65,10 +119,11 @@ class VisualizerWidget(QWidget):
 
     _VIZ_BARS  = 30
     _VIZ_DECAY = 0.80
-    _CLR_BG    = QColor("#000000")
-    _CLR_BAR   = QColor("#006600")
-    _CLR_PEAK  = QColor("#00FF00")
-    _CLR_IDLE  = QColor("#002200")
+    # Brushes/pens built once, so paintEvent never converts a QColor per call
+    _BRUSH_BG  = QBrush(QColor("#000000"))
+    _BRUSH_BAR = QBrush(QColor("#006600"))
+    _PEN_PEAK  = QPen(QColor("#00FF00"))
+    _PEN_IDLE  = QPen(QColor("#002200"))
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -77,15 +132,23 @@ class VisualizerWidget(QWidget):
         self._bars: list[float] = []
         self._peaks: list[float] = []
         self._decoding = False
+        self._xs: list[int] = []  # bar left edges, recomputed on resize
+        self._bar_w = 1
 
     def update_viz(self, bars: list[float], peaks: list[float]):
+        # Silence, pause or an idle panel repeats the same frame — don't
+        # schedule a repaint for it. 30-element list compares are C-level.
+        if bars == self._bars and peaks == self._peaks:
+            return
         self._bars = bars
         self._peaks = peaks
         self.update()
 
     def set_decoding(self, state: bool):
-        self._decoding = state
-        if not state:
+        # Repaint on change here, since update_viz([], []) no longer
+        # repaints an already-idle panel to show or clear the caption
+        if state != self._decoding:
+            self._decoding = state
             self.update()
 
     def paintEvent(self, _event):
@@ -93,83 +156,270 @@ class VisualizerWidget(QWidget):
         w = self.width()
         h = self.height()
 
-        painter.fillRect(0, 0, w, h, self._CLR_BG)
+        painter.fillRect(0, 0, w, h, self._BRUSH_BG)
 
         if not self._bars:
             mid = h // 2
-            painter.setPen(self._CLR_IDLE)
+            painter.setPen(self._PEN_IDLE)
             painter.drawLine(0, mid, w, mid)
             if self._decoding:
-                painter.setFont(QFont("Courier", 7))
+                painter.setFont(_font("Courier", 7))
                 painter.drawText(0, 0, w, h, Qt.AlignmentFlag.AlignCenter, "decoding…")
             return
 
-        N = len(self._bars)
-        bar_w = max(1, (w - N) // N)
-        step   = bar_w + 1
-        offset = (w - N * step) // 2
-        max_h  = h - 2
+        if len(self._xs) != len(self._bars):
+            self._layout_bars()
+        bar_w = self._bar_w
+        max_h = h - 2
 
-        for i, (amp, pk) in enumerate(zip(self._bars, self._peaks)):
-            x0 = offset + i * step
-            x1 = x0 + bar_w
+        # Build every bar and peak cap first, then submit each set in one call
+        rects, lines = [], []
+        for x0, amp, pk in zip(self._xs, self._bars, self._peaks):
             bh = max(1, int(amp * max_h))
-            ph = max(1, int(pk  * max_h))
-            painter.fillRect(x0, h - bh, bar_w, bh, self._CLR_BAR)
-            painter.setPen(self._CLR_PEAK)
-            painter.drawLine(x0, h - ph - 1, x1, h - ph - 1)
+            py = h - max(1, int(pk * max_h)) - 1
+            rects.append(QRect(x0, h - bh, bar_w, bh))
+            lines.append(QLine(x0, py, x0 + bar_w, py))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._BRUSH_BAR)
+        painter.drawRects(rects)
+        painter.setPen(self._PEN_PEAK)
+        painter.drawLines(lines)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout_bars()
+
+    def _layout_bars(self):
+        """Cache bar width and x positions; they only change with size or bar count."""
+        w = self.width()
+        N = len(self._bars) or self._VIZ_BARS
+        self._bar_w = max(1, (w - N) // N)
+        step   = self._bar_w + 1
+        offset = (w - N * step) // 2
+        self._xs = [offset + i * step for i in range(N)]
 
 
 # ---------------------------------------------------------------------------
-# Track row helper — stores playlist index for click handling
+# Track list model — group headers and track rows in one flat list
 # ---------------------------------------------------------------------------
 
-class _TrackRow(QWidget):
-    def __init__(self, playlist_idx: int, num: str, name: str, duration: str,
-                 on_click, bg: str, parent=None):
+class _TrackGroup:
+    """One collapsible section of the track list."""
+    __slots__ = ('key', 'title', 'tracks', 'num_offset', 'expanded')
+
+    def __init__(self, key, title: str, tracks: list, num_offset: int, expanded: bool):
+        self.key = key
+        self.title = title
+        self.tracks = tracks  # [(playlist_idx, path), ...]
+        self.num_offset = num_offset
+        self.expanded = expanded
+
+
+class TrackListModel(QAbstractListModel):
+    """Every group of the track list as one flat model: each group is a
+    header row followed, while expanded, by its track rows. Only the groups
+    are stored; a row is resolved to (group, offset) by bisecting the header
+    rows, names come from the window's display-name list and durations are
+    looked up when a row is first painted, so collapsed or off-screen rows
+    cost nothing beyond their tuple."""
+
+    IndexRole    = Qt.ItemDataRole.UserRole + 1
+    NumRole      = Qt.ItemDataRole.UserRole + 2
+    DurationRole = Qt.ItemDataRole.UserRole + 3
+    ActiveRole   = Qt.ItemDataRole.UserRole + 4
+    HeaderRole   = Qt.ItemDataRole.UserRole + 5
+    ExpandedRole = Qt.ItemDataRole.UserRole + 6
+
+    def __init__(self, names: list, duration_of, parent=None):
         super().__init__(parent)
-        self._playlist_idx = playlist_idx
-        self._on_click = on_click
-        self._bg_normal = bg
-        self._active = False
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 1, 0, 1)
-        layout.setSpacing(0)
-
-        self._num_lbl  = QLabel(num)
-        self._name_lbl = QLabel(name)
-        self._dur_lbl  = QLabel(duration)
-
-        for lbl in (self._num_lbl, self._name_lbl, self._dur_lbl):
-            lbl.setFont(QFont("Arial", 10))
-
-        self._num_lbl.setFixedWidth(34)
-        self._num_lbl.setContentsMargins(18, 0, 0, 0)
-        self._dur_lbl.setFixedWidth(52)
-        self._dur_lbl.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self._dur_lbl.setContentsMargins(0, 0, 5, 0)
-        self._name_lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-
-        layout.addWidget(self._num_lbl)
-        layout.addWidget(self._name_lbl)
-        layout.addWidget(self._dur_lbl)
-
-        self._apply_colors(False)
-
-    def _apply_colors(self, active: bool):
-        bg = "#000080" if active else self._bg_normal
-        fg = "white"   if active else "black"
-        for lbl in (self._num_lbl, self._name_lbl, self._dur_lbl, self):
-            lbl.setStyleSheet(f"background: {bg}; color: {fg};")
-
-    def set_active(self, active: bool):
-        if self._active != active:
-            self._active = active
-            self._apply_colors(active)
-
-    def mousePressEvent(self, _event):
-        self._on_click(self._playlist_idx)
+        self._names = names
+        self._duration_of = duration_of
+        self._groups: list[_TrackGroup] = []
+        self._starts: list[int] = []  # header row of each group
+        self._rows = 0
+        self._group_of: dict = {}  # playlist idx -> (group position, offset)
+        self._active_pi: int | None = None
+
+    def reset(self, names: list, active_pi: int | None = None):
+        self.beginResetModel()
+        self._names = names
+        self._groups = []
+        self._starts = []
+        self._rows = 0
+        self._group_of = {}
+        self._active_pi = active_pi
+        self.endResetModel()
+
+    def append_group(self, group: _TrackGroup):
+        n = 1 + (len(group.tracks) if group.expanded else 0)
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows + n - 1)
+        g = len(self._groups)
+        self._groups.append(group)
+        self._starts.append(self._rows)
+        self._rows += n
+        for offset, (pi, _) in enumerate(group.tracks):
+            self._group_of[pi] = (g, offset)
+        self.endInsertRows()
+
+    def _reindex(self):
+        row, starts = 0, []
+        for group in self._groups:
+            starts.append(row)
+            row += 1 + (len(group.tracks) if group.expanded else 0)
+        self._starts = starts
+        self._rows = row
+
+    def group_at(self, row: int) -> _TrackGroup:
+        return self._groups[bisect.bisect_right(self._starts, row) - 1]
+
+    def set_expanded(self, header_row: int, expanded: bool):
+        """Collapse or expand the group whose header is at header_row by
+        removing or inserting just its track rows."""
+        group = self.group_at(header_row)
+        if group.expanded == expanded:
+            return
+        first, last = header_row + 1, header_row + len(group.tracks)
+        if expanded:
+            self.beginInsertRows(QModelIndex(), first, last)
+        else:
+            self.beginRemoveRows(QModelIndex(), first, last)
+        group.expanded = expanded
+        self._reindex()
+        if expanded:
+            self.endInsertRows()
+        else:
+            self.endRemoveRows()
+        idx = self.index(header_row)
+        self.dataChanged.emit(idx, idx, [self.ExpandedRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        g = bisect.bisect_right(self._starts, row) - 1
+        group = self._groups[g]
+        offset = row - self._starts[g] - 1
+        if offset < 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return group.title
+            if role == self.NumRole:
+                return f"{len(group.tracks)} tracks" if group.tracks else ""
+            if role == self.HeaderRole:
+                return True
+            if role == self.ExpandedRole:
+                # None for a trackless placeholder, which gets no chevron
+                return group.expanded if group.tracks else None
+            return None
+        pi, file_path = group.tracks[offset]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[pi]
+        if role == self.NumRole:
+            return f"{group.num_offset + offset + 1:02d}."
+        if role == self.DurationRole:
+            return self._duration_of(file_path)
+        if role == self.ActiveRole:
+            return pi == self._active_pi
+        if role == self.IndexRole:
+            return pi
+        if role == self.HeaderRole:
+            return False
+        return None
+
+    def _row_of(self, pi: int | None) -> int | None:
+        pos = self._group_of.get(pi)
+        if pos is None:
+            return None
+        g, offset = pos
+        if not self._groups[g].expanded:
+            return None
+        return self._starts[g] + 1 + offset
+
+    def set_active(self, pi: int | None):
+        """Move the highlight; only the old and new rows are repainted."""
+        rows = (self._row_of(self._active_pi), self._row_of(pi))
+        self._active_pi = pi
+        for row in rows:
+            if row is not None:
+                idx = self.index(row)
+                self.dataChanged.emit(idx, idx, [self.ActiveRole])
+
+
+class TrackDelegate(QStyledItemDelegate):
+    """Paints track rows and group headers straight from the model's roles —
+    one shared instance draws every row, so no per-row widgets exist at all."""
+
+    _BRUSH_ACTIVE_BG = QBrush(QColor("#000080"))
+    _PEN_FG          = QPen(QColor("black"))
+    _PEN_ACTIVE_FG   = QPen(QColor("white"))
+    _PEN_COUNT_FG    = QPen(QColor("#303030"))
+    HEADER_HEIGHT    = 24
+
+    def __init__(self, bg: str, header_bg: str, parent=None):
+        super().__init__(parent)
+        self._brush_bg = QBrush(QColor(bg))
+        self._brush_header_bg = QBrush(QColor(header_bg))
+        self._font = _font("Arial", 10)
+        self._bold_font = _font("Arial", 10, True)
+        self._count_font = _font("Arial", 9)
+        self._metrics = QFontMetrics(self._font)
+        self._bold_metrics = QFontMetrics(self._bold_font)
+        self.row_height = self._metrics.height() + 3
+        self._header_size = QSize(0, self.HEADER_HEIGHT)
+        self._row_size = QSize(0, self.row_height)
+
+    def sizeHint(self, _option, index):
+        if index.data(TrackListModel.HeaderRole):
+            return self._header_size
+        return self._row_size
+
+    def paint(self, painter, option, index):
+        if index.data(TrackListModel.HeaderRole):
+            self._paint_header(painter, option.rect, index)
+            return
+        r = option.rect
+        x, y, w, h = r.x(), r.y(), r.width(), r.height()
+        active = index.data(TrackListModel.ActiveRole)
+
+        painter.save()
+        painter.fillRect(r, self._BRUSH_ACTIVE_BG if active else self._brush_bg)
+        painter.setPen(self._PEN_ACTIVE_FG if active else self._PEN_FG)
+        painter.setFont(self._font)
+
+        # Same geometry the old label layout used: 34px number column
+        # (18px indent), expanding name, 52px right-aligned duration.
+        left   = Qt.AlignmentFlag.AlignLeft  | Qt.AlignmentFlag.AlignVCenter
+        right  = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        name_w = max(0, w - 34 - 52)
+        name   = self._metrics.elidedText(index.data(), Qt.TextElideMode.ElideRight, name_w)
+        painter.drawText(x + 18, y, 16, h, left, index.data(TrackListModel.NumRole))
+        painter.drawText(x + 34, y, name_w, h, left, name)
+        painter.drawText(x + w - 52, y, 47, h, right, index.data(TrackListModel.DurationRole))
+        painter.restore()
+
+    def _paint_header(self, painter, r, index):
+        x, y, w, h = r.x(), r.y(), r.width(), r.height()
+        left  = Qt.AlignmentFlag.AlignLeft  | Qt.AlignmentFlag.AlignVCenter
+        right = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+        painter.save()
+        painter.fillRect(r, self._brush_header_bg)
+        painter.setPen(self._PEN_FG)
+        painter.setFont(self._bold_font)
+        # Geometry of the old header widget: 6px margins, 18px chevron,
+        # stretching title, 58px right-aligned count, 4px spacing.
+        expanded = index.data(TrackListModel.ExpandedRole)
+        chevron = "" if expanded is None else "▼" if expanded else "▶"
+        title_w = max(0, w - 6 - 18 - 4 - 4 - 58 - 5)
+        title   = self._bold_metrics.elidedText(index.data(), Qt.TextElideMode.ElideRight, title_w)
+        painter.drawText(x + 6, y, 18, h, left, chevron)
+        painter.drawText(x + 28, y, title_w, h, left, title)
+        painter.setPen(self._PEN_COUNT_FG)
+        painter.setFont(self._count_font)
+        painter.drawText(x + w - 63, y, 58, h, right, index.data(TrackListModel.NumRole))
+        painter.restore()
 
 
 # ---------------------------------------------------------------------------
@@ -182,6 +432,19 @@ class PlayerUI(QMainWindow):
     _VIZ_BARS  = VisualizerWidget._VIZ_BARS
     _VIZ_DECAY = VisualizerWidget._VIZ_DECAY
 
+    _POPULATE_BATCH = 50  # group sections built per event-loop iteration
+    _LAYOUT_BATCH   = 200  # track-list rows the view lays out per iteration
+    _ART_CACHE_SIZE = 64  # album-art pixmaps kept for recently played files
+
+    # (cache_key, cover digest or None, QImage or None) — emitted from the art worker thread
+    _art_ready = Signal(object, object, object)
+    # (file_path, (raw bytes, QImage) or None) — emitted from a network worker
+    _online_art_ready = Signal(object, object)
+    # (raw bytes, QImage) of an image picked via File > Load Art — from the art worker
+    _file_art_ready = Signal(object, object)
+    # {path: metadata dict} — emitted once a background tag prefetch finishes
+    _meta_ready = Signal(object)
+
     # Win95 palette
     WIN95_GRAY       = "#C0C0C0"
     WIN95_DARK_GRAY  = "#808080"
@@ -190,11 +453,93 @@ class PlayerUI(QMainWindow):
     LCD_BG           = "#000000"
     TRACKLIST_BG     = "#A8A8A8"
     ACTIVE_BLUE      = "#000080"
+    GROUP_HEADER_BG  = "#909090"
+
+    # Stylesheets — formatted once when the class is created, not per call
+    _STYLESHEET = f"""
+        QMainWindow, QWidget {{
+            background: {WIN95_GRAY};
+            color: black;
+            font-family: Arial;
+        }}
+        QPushButton {{
+            background: {WIN95_LIGHT_GRAY};
+            border: 2px solid {WIN95_DARK_GRAY};
+            border-radius: 3px;
+            color: black;
+        }}
+        QPushButton:hover  {{ background: {WIN95_GRAY}; }}
+        QPushButton:pressed {{ border-style: inset; background: #B0B0B0; }}
+        QPushButton[active="true"] {{
+            background: {ACTIVE_BLUE};
+            color: white;
+        }}
+        QSlider::groove:horizontal {{
+            height: 6px;
+            background: {WIN95_DARK_GRAY};
+            border-radius: 2px;
+        }}
+        QSlider::handle:horizontal {{
+            width: 14px;
+            height: 18px;
+            background: {WIN95_DARK_GRAY};
+            border: 1px solid #404040;
+            margin: -6px 0;
+            border-radius: 2px;
+        }}
+        QSlider::sub-page:horizontal {{ background: {LCD_GREEN}; border-radius: 2px; }}
+        QLineEdit {{
+            background: white;
+            color: black;
+            border: 1px solid {WIN95_DARK_GRAY};
+            font-size: 9pt;
+            padding: 1px 3px;
+        }}
+        QListView  {{ border: 2px solid {WIN95_DARK_GRAY}; background: {TRACKLIST_BG}; }}
+        QScrollBar:vertical {{ background: {WIN95_GRAY}; width: 14px; }}
+        QScrollBar::handle:vertical {{ background: {WIN95_DARK_GRAY}; min-height: 20px; }}
+        QMenuBar  {{ background: {WIN95_GRAY}; color: black; }}
+        QMenuBar::item:selected {{ background: {ACTIVE_BLUE}; color: white; }}
+        QMenu {{
+            background: {WIN95_GRAY};
+            color: black;
+            border: 1px solid {WIN95_DARK_GRAY};
+        }}
+        QMenu::item:selected {{ background: {ACTIVE_BLUE}; color: white; }}
+        QFrame#lcdPanel, QFrame#lcdPanel * {{
+            background: {LCD_BG};
+            border: 2px solid {WIN95_DARK_GRAY};
+        }}
+        QFrame#lcdPanel QLabel {{ color: {LCD_GREEN}; }}
+    """
+    _QSS_TOGGLE_ON  = f"background: {ACTIVE_BLUE}; color: white;"
+    _QSS_TOGGLE_OFF = f"background: {WIN95_LIGHT_GRAY}; color: black;"
+    _QSS_SORT_ON    = f"background: {ACTIVE_BLUE}; color: white; border: 1px solid {WIN95_DARK_GRAY};"
+    _QSS_SORT_OFF   = f"background: {WIN95_LIGHT_GRAY}; color: black; border: 1px solid {WIN95_DARK_GRAY};"
+    _QSS_RADIO_PANEL = f"""
+        * {{ background: {WIN95_GRAY}; border: 1px solid {WIN95_DARK_GRAY}; }}
+        QPushButton#radioPreset, QPushButton#radioFavPlay, QPushButton#radioFavRemove {{
+            background: {WIN95_LIGHT_GRAY};
+        }}
+        QPushButton#radioFavPlay {{ text-align: left; padding-left: 4px; }}
+        QPushButton#radioPreset:hover, QPushButton#radioFavPlay:hover {{
+            background: {ACTIVE_BLUE};
+            color: white;
+        }}
+        QPushButton#radioFavRemove:hover {{ background: #CC4444; color: white; }}
+    """
 
     def __init__(self, audio_player):
         super().__init__()
         self.audio_player = audio_player
-        self.default_music_folder = self._load_config().get('last_folder')
+        self._config = self._load_config()
+        self.default_music_folder = self._config.get('last_folder')
+
+        # Config writes are coalesced: _save_config() patches self._config
+        # and (re)starts this timer; _flush_config() does the disk write.
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.timeout.connect(self._flush_config)
 
         self.setWindowTitle("lepeplabs_audio_thing")
         self.setFixedSize(780, 720)
@@ -202,22 +547,60 @@ class PlayerUI(QMainWindow):
         # State
         self.seeking            = False
         self._seek_pending      = 0.0
-        self._pending_art_image = None
+        self._last_time_text    = None  # last text/value pushed by _update_tick
+        self._last_time_secs    = None  # (position, duration) whole seconds behind _last_time_text
+        self._last_seek_tick    = -1
+        self._pending_art_image = None  # (raw bytes, mime) awaiting "Save Art to Tags"
         self.current_album_art  = None
+        self._art_cache: OrderedDict = OrderedDict()  # (path, mtime) -> QPixmap | None
+        self._art_digests: set[str] = set()  # cover digests converted into QPixmapCache
+        self._art_exec = ThreadPoolExecutor(max_workers=1)
+        self._art_ready.connect(self._apply_album_art)
+        self._net_exec = ThreadPoolExecutor(max_workers=2)
+        self._online_art_ready.connect(self._apply_online_art)
+        self._file_art_ready.connect(self._apply_file_art)
         self.folder_states: dict = {}
         self.sort_mode          = 'folder'
         self._meta_cache: dict  = {}
+        self._meta_disk: dict   = self._load_meta_cache()  # path -> {mtime, meta, duration}
+        # Disk-cache writes are coalesced like config writes, and the JSON
+        # dump runs on its own single worker so writes land in order and
+        # never queue behind tag reads
+        self._meta_flush_timer = QTimer(self)
+        self._meta_flush_timer.setSingleShot(True)
+        self._meta_flush_timer.timeout.connect(self._save_meta_cache)
+        self._meta_write_exec = ThreadPoolExecutor(max_workers=1)
+        # Tag reads are I/O-bound, so threads overlap them despite the GIL
+        self._meta_exec = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        self._meta_inflight: set[str] = set()  # paths being prefetched
+        self._closing = False  # set in closeEvent; queued tag reads bail out
+        self._meta_ready.connect(self._apply_prefetched_meta)
+        self._duration_cache: dict = {}  # path -> formatted "M:SS"
+        self._search_blobs: dict = {}    # path -> "name\0artist\0album", lowercased
         self._sort_buttons: dict = {}
         self._search_text       = ''
-        self._track_rows: list[_TrackRow] = []
+        self._search_tokens: list[str] = []  # _search_text split on whitespace
+        self._applied_search    = ''  # _search_text as of the last rebuild
+        # Coalesces a burst of keystrokes into one tracklist rebuild
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._request_populate)
+        self._highlighted_pi: int | None = None
+        self._populate_gen      = None  # in-flight populate_tracklist() generator
+        self._tracklist_dirty   = False  # a rebuild was requested while hidden
+        self._display_names: list[str] = []        # parallel to audio_player.playlist
+        self._name_cache: dict = {}  # path -> display name
 
         # Radio state
         self._radio_playing      = False
-        self._radio_favourites   = self._load_config().get('radio_favourites', [])
+        self._radio_favourites   = self._config.get('radio_favourites', [])
         self._radio_frame        = None
         self._radio_url_entry    = None
         self._radio_play_btn     = None
         self._radio_favs_inner   = None
+        self._radio_favs_empty   = None  # "No saved stations" placeholder label
+        self._fav_row_widgets: list[tuple[dict, QWidget]] = []  # (favourite, row)
 
         # Search state
         self._search_frame  = None
@@ -228,6 +611,7 @@ class PlayerUI(QMainWindow):
         self._viz_widget:  VisualizerWidget | None = None
         self._viz_peaks:   list[float] = []
         self._viz_decoding = False
+        self._last_viz_pos: float | None = None  # position of the last drawn frame
 
         # Right panel layout reference (for dynamic panel insertion)
         self._right_layout: QVBoxLayout | None = None
@@ -250,72 +634,31 @@ class PlayerUI(QMainWindow):
         # Native drag-and-drop
         self.setAcceptDrops(True)
 
-        # Auto-load last folder
-        if self.default_music_folder and os.path.exists(self.default_music_folder):
-            if self.audio_player.add_folder(self.default_music_folder):
-                self.populate_tracklist()
+        # Auto-load last folder once the event loop is running, so the
+        # directory scan happens after the window's first paint
+        QTimer.singleShot(0, self._late_init)
 
-        # 100ms update timer
+        # Position/time readout and auto-advance don't need more than 4 Hz;
+        # the visualizer gets its own ~30 fps timer so neither holds up the other.
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._update_tick)
-        self._timer.start(100)
+        self._timer.start(250)
+
+        self._viz_timer = QTimer(self)
+        self._viz_timer.timeout.connect(self._viz_tick)
+        self._viz_timer.start(33)
+
+    def _late_init(self):
+        if self.default_music_folder and os.path.exists(self.default_music_folder):
+            if self.audio_player.add_folder(self.default_music_folder):
+                self._request_populate()
 
     # ------------------------------------------------------------------
     # Stylesheet
     # ------------------------------------------------------------------
 
     def _apply_win95_stylesheet(self):
-        self.setStyleSheet(f"""
-            QMainWindow, QWidget {{
-                background: {self.WIN95_GRAY};
-                color: black;
-                font-family: Arial;
-            }}
-            QPushButton {{
-                background: {self.WIN95_LIGHT_GRAY};
-                border: 2px solid {self.WIN95_DARK_GRAY};
-                border-radius: 3px;
-                color: black;
-            }}
-            QPushButton:hover  {{ background: {self.WIN95_GRAY}; }}
-            QPushButton:pressed {{ border-style: inset; background: #B0B0B0; }}
-            QPushButton[active="true"] {{
-                background: {self.ACTIVE_BLUE};
-                color: white;
-            }}
-            QSlider::groove:horizontal {{
-                height: 6px;
-                background: {self.WIN95_DARK_GRAY};
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                width: 14px;
-                height: 18px;
-                background: {self.WIN95_DARK_GRAY};
-                border: 1px solid #404040;
-                margin: -6px 0;
-                border-radius: 2px;
-            }}
-            QSlider::sub-page:horizontal {{ background: {self.LCD_GREEN}; border-radius: 2px; }}
-            QLineEdit {{
-                background: white;
-                color: black;
-                border: 1px solid {self.WIN95_DARK_GRAY};
-                font-size: 9pt;
-                padding: 1px 3px;
-            }}
-            QScrollArea  {{ border: 2px solid {self.WIN95_DARK_GRAY}; background: {self.TRACKLIST_BG}; }}
-            QScrollBar:vertical {{ background: {self.WIN95_GRAY}; width: 14px; }}
-            QScrollBar::handle:vertical {{ background: {self.WIN95_DARK_GRAY}; min-height: 20px; }}
-            QMenuBar  {{ background: {self.WIN95_GRAY}; color: black; }}
-            QMenuBar::item:selected {{ background: {self.ACTIVE_BLUE}; color: white; }}
-            QMenu {{
-                background: {self.WIN95_GRAY};
-                color: black;
-                border: 1px solid {self.WIN95_DARK_GRAY};
-            }}
-            QMenu::item:selected {{ background: {self.ACTIVE_BLUE}; color: white; }}
-        """)
+        self.setStyleSheet(self._STYLESHEET)
 
     # ------------------------------------------------------------------
     # Menu bar
@@ -380,27 +723,25 @@ class PlayerUI(QMainWindow):
         # Album art
         art_frame = QFrame()
         art_frame.setFixedHeight(265)
-        art_frame.setStyleSheet(f"background: {self.LCD_BG}; border: 2px solid {self.WIN95_DARK_GRAY};")
+        art_frame.setObjectName("lcdPanel")
         art_inner = QVBoxLayout(art_frame)
         art_inner.setContentsMargins(0, 0, 0, 0)
 
         self.album_art_label = QLabel("No Album Art")
         self.album_art_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.album_art_label.setFont(QFont("Courier", 12, QFont.Weight.Bold))
-        self.album_art_label.setStyleSheet(f"color: {self.LCD_GREEN}; background: {self.LCD_BG};")
+        self.album_art_label.setFont(_font("Courier", 12, True))
         art_inner.addWidget(self.album_art_label)
         layout.addWidget(art_frame)
 
         # LCD display
         lcd_frame = QFrame()
         lcd_frame.setFixedHeight(90)
-        lcd_frame.setStyleSheet(f"background: {self.LCD_BG}; border: 2px solid {self.WIN95_DARK_GRAY};")
+        lcd_frame.setObjectName("lcdPanel")
         lcd_layout = QVBoxLayout(lcd_frame)
         lcd_layout.setContentsMargins(5, 5, 5, 5)
         lcd_layout.setSpacing(2)
 
         top_row_w = QWidget()
-        top_row_w.setStyleSheet(f"background: {self.LCD_BG};")
         top_row = QHBoxLayout(top_row_w)
         top_row.setContentsMargins(0, 0, 0, 0)
         top_row.setSpacing(4)
@@ -410,13 +751,11 @@ class PlayerUI(QMainWindow):
         top_row.addWidget(self.track_num)
 
         time_block = QWidget()
-        time_block.setStyleSheet(f"background: {self.LCD_BG};")
         time_blk_lay = QVBoxLayout(time_block)
         time_blk_lay.setContentsMargins(20, 0, 0, 0)
         time_blk_lay.setSpacing(0)
 
         min_sec_row = QWidget()
-        min_sec_row.setStyleSheet(f"background: {self.LCD_BG};")
         msr = QHBoxLayout(min_sec_row)
         msr.setContentsMargins(0, 0, 0, 0)
         msr.setSpacing(4)
@@ -433,8 +772,7 @@ class PlayerUI(QMainWindow):
         lcd_layout.addWidget(top_row_w)
 
         self.song_display = QLabel("No file loaded")
-        self.song_display.setFont(QFont("Courier", 11, QFont.Weight.Bold))
-        self.song_display.setStyleSheet(f"color: {self.LCD_GREEN}; background: {self.LCD_BG};")
+        self.song_display.setFont(_font("Courier", 11, True))
         self.song_display.setContentsMargins(10, 5, 10, 8)
         lcd_layout.addWidget(self.song_display)
         layout.addWidget(lcd_frame)
@@ -442,19 +780,17 @@ class PlayerUI(QMainWindow):
         # Metadata display
         meta_frame = QFrame()
         meta_frame.setFixedHeight(48)
-        meta_frame.setStyleSheet(f"background: {self.LCD_BG}; border: 2px solid {self.WIN95_DARK_GRAY};")
+        meta_frame.setObjectName("lcdPanel")
         meta_layout = QVBoxLayout(meta_frame)
         meta_layout.setContentsMargins(10, 4, 10, 4)
         meta_layout.setSpacing(0)
 
         self.artist_display = QLabel("")
-        self.artist_display.setFont(QFont("Courier", 10, QFont.Weight.Bold))
-        self.artist_display.setStyleSheet(f"color: {self.LCD_GREEN}; background: {self.LCD_BG};")
+        self.artist_display.setFont(_font("Courier", 10, True))
         meta_layout.addWidget(self.artist_display)
 
         self.album_display = QLabel("")
-        self.album_display.setFont(QFont("Courier", 10, QFont.Weight.Bold))
-        self.album_display.setStyleSheet(f"color: {self.LCD_GREEN}; background: {self.LCD_BG};")
+        self.album_display.setFont(_font("Courier", 10, True))
         meta_layout.addWidget(self.album_display)
         layout.addWidget(meta_frame)
 
@@ -485,19 +821,19 @@ class PlayerUI(QMainWindow):
 
         self.shuffle_btn = QPushButton("🔀")
         self.shuffle_btn.setFixedSize(80, 28)
-        self.shuffle_btn.setFont(QFont("Arial", 11))
+        self.shuffle_btn.setFont(_font("Arial", 11))
         self.shuffle_btn.clicked.connect(self.toggle_shuffle)
         controls_grid.addWidget(self.shuffle_btn, 1, 0, 1, 3)
 
         self.repeat_btn = QPushButton("🔁 Off")
         self.repeat_btn.setFixedSize(110, 28)
-        self.repeat_btn.setFont(QFont("Arial", 11))
+        self.repeat_btn.setFont(_font("Arial", 11))
         self.repeat_btn.clicked.connect(self.cycle_repeat)
         controls_grid.addWidget(self.repeat_btn, 1, 3, 1, 3)
 
         clear_btn = QPushButton("🗑 Clear All")
         clear_btn.setFixedHeight(24)
-        clear_btn.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        clear_btn.setFont(_font("Arial", 10, True))
         clear_btn.setStyleSheet(f"""
             QPushButton {{ background: {self.WIN95_LIGHT_GRAY}; border: 2px solid {self.WIN95_DARK_GRAY}; }}
             QPushButton:hover {{ background: #CC4444; color: white; }}
@@ -523,7 +859,7 @@ class PlayerUI(QMainWindow):
         # Visualizer
         viz_frame = QFrame()
         viz_frame.setFixedHeight(64)
-        viz_frame.setStyleSheet(f"background: {self.LCD_BG}; border: 2px solid {self.WIN95_DARK_GRAY};")
+        viz_frame.setObjectName("lcdPanel")
         viz_inner = QVBoxLayout(viz_frame)
         viz_inner.setContentsMargins(1, 1, 1, 1)
 
@@ -537,7 +873,7 @@ class PlayerUI(QMainWindow):
         vol_lay.setContentsMargins(0, 5, 0, 5)
 
         vol_label = QLabel("VOL")
-        vol_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        vol_label.setFont(_font("Arial", 10, True))
         vol_lay.addWidget(vol_label)
 
         self.volume_slider = QSlider(Qt.Orientation.Horizontal)
@@ -548,7 +884,7 @@ class PlayerUI(QMainWindow):
         vol_lay.addWidget(self.volume_slider)
 
         self.volume_label = QLabel("70%")
-        self.volume_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        self.volume_label.setFont(_font("Arial", 10, True))
         self.volume_label.setFixedWidth(40)
         vol_lay.addWidget(self.volume_label)
 
@@ -574,18 +910,14 @@ class PlayerUI(QMainWindow):
         header_lay.setContentsMargins(0, 0, 0, 5)
 
         tl_label = QLabel("TRACK LIST")
-        tl_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        tl_label.setFont(_font("Arial", 12, True))
         header_lay.addWidget(tl_label)
         header_lay.addStretch()
 
-        pl_btn_style = (
-            f"QPushButton {{ width: 60px; height: 22px; font-size: 9pt; font-weight: bold; }}"
-        )
-
         def _pl_btn(text, slot, width=60):
             b = QPushButton(text)
             b.setFixedSize(width, 22)
-            b.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+            b.setFont(_font("Arial", 9, True))
             b.clicked.connect(slot)
             return b
 
@@ -624,18 +956,18 @@ class PlayerUI(QMainWindow):
         sort_lay.setSpacing(4)
 
         sort_lbl = QLabel("Group by:")
-        sort_lbl.setFont(QFont("Arial", 9))
+        sort_lbl.setFont(_font("Arial", 9))
         sort_lay.addWidget(sort_lbl)
 
         for mode, label in [("folder", "📁 Folder"), ("artist", "👤 Artist"),
                              ("album",  "💿 Album"),  ("genre",  "🎵 Genre")]:
             btn = QPushButton(label)
             btn.setFixedSize(68, 20)
-            btn.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+            btn.setFont(_font("Arial", 9, True))
             if mode == 'folder':
-                btn.setStyleSheet(f"background: {self.ACTIVE_BLUE}; color: white; border: 1px solid {self.WIN95_DARK_GRAY};")
+                btn.setStyleSheet(self._QSS_SORT_ON)
             else:
-                btn.setStyleSheet(f"background: {self.WIN95_LIGHT_GRAY}; color: black; border: 1px solid {self.WIN95_DARK_GRAY};")
+                btn.setStyleSheet(self._QSS_SORT_OFF)
             btn.clicked.connect(lambda checked=False, m=mode: self._set_sort_mode(m))
             sort_lay.addWidget(btn)
             self._sort_buttons[mode] = btn
@@ -644,23 +976,26 @@ class PlayerUI(QMainWindow):
         layout.addWidget(sort_bar)  # idx 1
         self._sort_bar_idx = 1      # sort_bar is at index 1 (nothing inserted above yet)
 
-        # Scrollable track list
-        self._tracklist_scroll = QScrollArea()
-        self._tracklist_scroll.setWidgetResizable(True)
-        self._tracklist_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._tracklist_scroll.setStyleSheet(
-            f"QScrollArea {{ background: {self.TRACKLIST_BG}; border: 2px solid {self.WIN95_DARK_GRAY}; }}"
-        )
-
-        self._tracklist_inner = QWidget()
-        self._tracklist_inner.setStyleSheet(f"background: {self.TRACKLIST_BG};")
-        self._tracklist_layout = QVBoxLayout(self._tracklist_inner)
-        self._tracklist_layout.setContentsMargins(0, 0, 0, 0)
-        self._tracklist_layout.setSpacing(0)
-        self._tracklist_layout.addStretch()
-
-        self._tracklist_scroll.setWidget(self._tracklist_inner)
-        layout.addWidget(self._tracklist_scroll, stretch=1)  # idx 2
+        # Track list: one view over one flat model of group headers and
+        # tracks. The view only asks the delegate to paint the rows that are
+        # actually on screen, however large the library is.
+        self._track_model = TrackListModel(self._display_names, self._get_cached_duration, self)
+        self._track_delegate = TrackDelegate(self.TRACKLIST_BG, self.GROUP_HEADER_BG, self)
+        self._tracklist_view = QListView()
+        self._tracklist_view.setModel(self._track_model)
+        self._tracklist_view.setItemDelegate(self._track_delegate)
+        # Lay very large lists out a batch at a time from the event loop
+        self._tracklist_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self._tracklist_view.setBatchSize(self._LAYOUT_BATCH)
+        self._tracklist_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self._tracklist_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._tracklist_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._tracklist_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        # No WA_OpaquePaintEvent on the viewport: below the last row it's the
+        # view's own background that shows, so Qt has to keep filling it
+        self._tracklist_view.clicked.connect(self._on_tracklist_clicked)
+        self._tracklist_view.installEventFilter(self)  # flush deferred rebuilds on show
+        layout.addWidget(self._tracklist_view, stretch=1)  # idx 2
 
         return frame
 
@@ -678,7 +1013,9 @@ class PlayerUI(QMainWindow):
         ]
 
         frame = QFrame()
-        frame.setStyleSheet(f"background: {self.WIN95_GRAY}; border: 1px solid {self.WIN95_DARK_GRAY};")
+        # One sheet for the whole panel: preset and saved-station buttons are
+        # styled by object name here, so adding rows parses no QSS
+        frame.setStyleSheet(self._QSS_RADIO_PANEL)
         flayout = QVBoxLayout(frame)
         flayout.setContentsMargins(4, 4, 4, 4)
         flayout.setSpacing(2)
@@ -697,13 +1034,13 @@ class PlayerUI(QMainWindow):
 
         self._radio_play_btn = QPushButton("▶ Play")
         self._radio_play_btn.setFixedSize(58, 24)
-        self._radio_play_btn.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        self._radio_play_btn.setFont(_font("Arial", 9, True))
         self._radio_play_btn.clicked.connect(self._radio_play_url)
         url_lay.addWidget(self._radio_play_btn)
 
         save_fav_btn = QPushButton("★ Save")
         save_fav_btn.setFixedSize(58, 24)
-        save_fav_btn.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        save_fav_btn.setFont(_font("Arial", 9, True))
         save_fav_btn.setStyleSheet(
             f"QPushButton {{ background: {self.WIN95_LIGHT_GRAY}; }}"
             f"QPushButton:hover {{ background: #DAA520; }}"
@@ -714,7 +1051,6 @@ class PlayerUI(QMainWindow):
 
         # Preset row
         presets_row = QWidget()
-        presets_row.setStyleSheet(f"background: {self.WIN95_GRAY};")
         presets_lay = QHBoxLayout(presets_row)
         presets_lay.setContentsMargins(0, 0, 0, 0)
         presets_lay.setSpacing(2)
@@ -722,11 +1058,8 @@ class PlayerUI(QMainWindow):
         for name, url in PRESETS:
             btn = QPushButton(name)
             btn.setFixedHeight(20)
-            btn.setFont(QFont("Arial", 8))
-            btn.setStyleSheet(
-                f"QPushButton {{ background: {self.WIN95_LIGHT_GRAY}; border: 1px solid {self.WIN95_DARK_GRAY}; }}"
-                f"QPushButton:hover {{ background: {self.ACTIVE_BLUE}; color: white; }}"
-            )
+            btn.setFont(_font("Arial", 8))
+            btn.setObjectName("radioPreset")
             btn.clicked.connect(lambda checked=False, n=name, u=url: self._radio_play_preset(n, u))
             presets_lay.addWidget(btn)
 
@@ -735,67 +1068,78 @@ class PlayerUI(QMainWindow):
 
         # Saved stations header
         hdr = QLabel("── Saved Stations ──")
-        hdr.setFont(QFont("Arial", 8))
+        hdr.setFont(_font("Arial", 8))
         hdr.setStyleSheet(f"color: {self.WIN95_DARK_GRAY}; background: {self.WIN95_GRAY};")
         flayout.addWidget(hdr)
 
         # Inner container for saved stations
         self._radio_favs_inner = QWidget()
-        self._radio_favs_inner.setStyleSheet(f"background: {self.WIN95_GRAY};")
         self._radio_favs_layout = QVBoxLayout(self._radio_favs_inner)
         self._radio_favs_layout.setContentsMargins(0, 0, 0, 0)
         self._radio_favs_layout.setSpacing(1)
         flayout.addWidget(self._radio_favs_inner)
 
+        self._radio_favs_empty = QLabel("No saved stations — play a stream and click ★ Save")
+        self._radio_favs_empty.setFont(_font("Arial", 8))
+        self._radio_favs_empty.setStyleSheet(f"color: {self.WIN95_DARK_GRAY}; background: {self.WIN95_GRAY};")
+        self._radio_favs_layout.addWidget(self._radio_favs_empty)
+
         self._radio_refresh_favourites()
         return frame
 
     def _radio_refresh_favourites(self):
+        """Sync the saved-station rows with _radio_favourites. Rows are matched
+        to entries by identity, so only added or removed stations touch widgets."""
         if self._radio_favs_inner is None:
             return
-        # Clear existing children
-        while self._radio_favs_layout.count():
-            item = self._radio_favs_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if not self._radio_favourites:
-            lbl = QLabel("No saved stations — play a stream and click ★ Save")
-            lbl.setFont(QFont("Arial", 8))
-            lbl.setStyleSheet(f"color: {self.WIN95_DARK_GRAY}; background: {self.WIN95_GRAY};")
-            self._radio_favs_layout.addWidget(lbl)
-            return
+        # One repaint for the whole sync rather than one per row touched
+        self._radio_favs_inner.setUpdatesEnabled(False)
+        try:
+            wanted = {id(fav) for fav in self._radio_favourites}
+            kept = []
+            for fav, row in self._fav_row_widgets:
+                if id(fav) in wanted:
+                    kept.append((fav, row))
+                else:
+                    self._radio_favs_layout.removeWidget(row)
+                    row.deleteLater()
+
+            have = {id(fav) for fav, _ in kept}
+            for pos, fav in enumerate(self._radio_favourites):
+                if id(fav) not in have:
+                    row = self._build_favourite_row(fav)
+                    # Rows sit in list order ahead of the trailing placeholder label
+                    self._radio_favs_layout.insertWidget(pos, row)
+                    kept.insert(pos, (fav, row))
+            self._fav_row_widgets = kept
+
+            self._radio_favs_empty.setVisible(not self._radio_favourites)
+        finally:
+            self._radio_favs_inner.setUpdatesEnabled(True)
+
+    def _build_favourite_row(self, fav: dict) -> QWidget:
+        """One saved-station row, styled by the radio panel's radioFav* rules."""
+        row = QWidget()
+        row_lay = QHBoxLayout(row)
+        row_lay.setContentsMargins(0, 0, 0, 0)
+        row_lay.setSpacing(4)
+
+        play_btn = QPushButton(f"▶  {fav['name']}")
+        play_btn.setFixedHeight(20)
+        play_btn.setFont(_font("Arial", 8))
+        play_btn.setObjectName("radioFavPlay")
+        play_btn.clicked.connect(
+            lambda checked=False, n=fav['name'], u=fav['url']: self._radio_play_preset(n, u)
+        )
+        row_lay.addWidget(play_btn, stretch=1)
 
-        for i, fav in enumerate(self._radio_favourites):
-            row = QWidget()
-            row.setStyleSheet(f"background: {self.WIN95_GRAY};")
-            row_lay = QHBoxLayout(row)
-            row_lay.setContentsMargins(0, 0, 0, 0)
-            row_lay.setSpacing(4)
-
-            play_btn = QPushButton(f"▶  {fav['name']}")
-            play_btn.setFixedHeight(20)
-            play_btn.setFont(QFont("Arial", 8))
-            play_btn.setStyleSheet(
-                f"QPushButton {{ background: {self.WIN95_LIGHT_GRAY}; border: 1px solid {self.WIN95_DARK_GRAY}; text-align: left; padding-left: 4px; }}"
-                f"QPushButton:hover {{ background: {self.ACTIVE_BLUE}; color: white; }}"
-            )
-            play_btn.clicked.connect(
-                lambda checked=False, n=fav['name'], u=fav['url']: self._radio_play_preset(n, u)
-            )
-            row_lay.addWidget(play_btn, stretch=1)
-
-            rm_btn = QPushButton("✕")
-            rm_btn.setFixedSize(24, 20)
-            rm_btn.setFont(QFont("Arial", 9, QFont.Weight.Bold))
-            rm_btn.setStyleSheet(
-                f"QPushButton {{ background: {self.WIN95_LIGHT_GRAY}; border: 1px solid {self.WIN95_DARK_GRAY}; }}"
-                f"QPushButton:hover {{ background: #CC4444; color: white; }}"
-            )
-            rm_btn.clicked.connect(lambda checked=False, idx=i: self._radio_remove_favourite(idx))
-            row_lay.addWidget(rm_btn)
-
-            self._radio_favs_layout.addWidget(row)
+        rm_btn = QPushButton("✕")
+        rm_btn.setFixedSize(24, 20)
+        rm_btn.setFont(_font("Arial", 9, True))
+        rm_btn.setObjectName("radioFavRemove")
+        rm_btn.clicked.connect(lambda checked=False, f=fav: self._radio_remove_favourite(f))
+        row_lay.addWidget(rm_btn)
+        return row
 
     def _radio_save_favourite(self):
         url = self._radio_url_entry.text().strip()
@@ -807,11 +1151,13 @@ class PlayerUI(QMainWindow):
             self._save_config({'radio_favourites': self._radio_favourites})
             self._radio_refresh_favourites()
 
-    def _radio_remove_favourite(self, idx: int):
-        if 0 <= idx < len(self._radio_favourites):
-            self._radio_favourites.pop(idx)
-            self._save_config({'radio_favourites': self._radio_favourites})
-            self._radio_refresh_favourites()
+    def _radio_remove_favourite(self, fav: dict):
+        for idx, f in enumerate(self._radio_favourites):
+            if f is fav:
+                self._radio_favourites.pop(idx)
+                self._save_config({'radio_favourites': self._radio_favourites})
+                self._radio_refresh_favourites()
+                return
 
     def _toggle_radio(self):
         if self._radio_frame.isVisible():
@@ -819,17 +1165,13 @@ class PlayerUI(QMainWindow):
                 self._stop_radio()
             self._right_layout.removeWidget(self._radio_frame)
             self._radio_frame.hide()
-            self._radio_btn.setStyleSheet(
-                f"background: {self.WIN95_LIGHT_GRAY}; color: black;"
-            )
+            self._radio_btn.setStyleSheet(self._QSS_TOGGLE_OFF)
             self._sort_bar_idx -= 1
         else:
             insert_idx = self._sort_bar_idx
             self._right_layout.insertWidget(insert_idx, self._radio_frame)
             self._radio_frame.show()
-            self._radio_btn.setStyleSheet(
-                f"background: {self.ACTIVE_BLUE}; color: white;"
-            )
+            self._radio_btn.setStyleSheet(self._QSS_TOGGLE_ON)
             self._sort_bar_idx += 1
 
     def _radio_play_url(self):
@@ -849,7 +1191,7 @@ class PlayerUI(QMainWindow):
             self._radio_play_btn.clicked.disconnect()
             self._radio_play_btn.clicked.connect(self._stop_radio)
             self.song_display.setText(f"📻 {name[:30]}")
-            self.time_display.setText("LIVE")
+            self._set_time_text("LIVE")
             self.artist_display.setText("")
             self.album_display.setText("")
             self.album_art_label.setPixmap(QPixmap())
@@ -864,7 +1206,7 @@ class PlayerUI(QMainWindow):
         self._radio_play_btn.clicked.disconnect()
         self._radio_play_btn.clicked.connect(self._radio_play_url)
         self.song_display.setText("No file loaded")
-        self.time_display.setText("0:00 / 0:00")
+        self._set_time_text("0:00 / 0:00")
         self.album_art_label.setPixmap(QPixmap())
         self.album_art_label.setText("No Album Art")
 
@@ -876,26 +1218,30 @@ class PlayerUI(QMainWindow):
         if self._search_frame.isVisible():
             self._right_layout.removeWidget(self._search_frame)
             self._search_frame.hide()
-            self._search_btn.setStyleSheet(
-                f"background: {self.WIN95_LIGHT_GRAY}; color: black;"
-            )
+            self._search_btn.setStyleSheet(self._QSS_TOGGLE_OFF)
             self._search_text = ''
+            self._search_tokens = []
             self._search_entry.clear()
-            self.populate_tracklist()
+            self._search_timer.stop()  # rebuilding right away instead
+            self._request_populate()
             self._sort_bar_idx -= 1
         else:
             insert_idx = self._sort_bar_idx
             self._right_layout.insertWidget(insert_idx, self._search_frame)
             self._search_frame.show()
-            self._search_btn.setStyleSheet(
-                f"background: {self.ACTIVE_BLUE}; color: white;"
-            )
+            self._search_btn.setStyleSheet(self._QSS_TOGGLE_ON)
             self._search_entry.setFocus()
             self._sort_bar_idx += 1
 
     def _on_search_change(self, text: str):
-        self._search_text = text.strip().lower()
-        self.populate_tracklist()
+        # Tokens are ANDed, so "bit matrix" also finds "Matrix Bit"
+        self._search_tokens = text.lower().split()
+        self._search_text = ' '.join(self._search_tokens)
+        if self._search_text == self._applied_search:
+            # e.g. a typo fixed with backspace, or trailing whitespace
+            self._search_timer.stop()
+            return
+        self._search_timer.start()
 
     # ------------------------------------------------------------------
     # Visualizer
@@ -910,17 +1256,16 @@ class PlayerUI(QMainWindow):
             self._viz_widget.update_viz([], [])
             return
 
-        N = len(bars)
-        if len(self._viz_peaks) != N:
-            self._viz_peaks = [0.0] * N
-
-        for i, amp in enumerate(bars):
-            if amp >= self._viz_peaks[i]:
-                self._viz_peaks[i] = amp
-            else:
-                self._viz_peaks[i] = max(amp, self._viz_peaks[i] * self._VIZ_DECAY)
+        peaks = self._viz_peaks
+        if len(peaks) != len(bars):
+            peaks = [0.0] * len(bars)
 
-        self._viz_widget.update_viz(bars, list(self._viz_peaks))
+        # A fresh list each frame rather than updating in place and copying,
+        # so the widget never shares the list the next frame rewrites. For
+        # amp >= peak, max(amp, peak * decay) is just amp.
+        decay = self._VIZ_DECAY
+        self._viz_peaks = [max(amp, pk * decay) for amp, pk in zip(bars, peaks)]
+        self._viz_widget.update_viz(bars, self._viz_peaks)
 
     def _start_waveform_compute(self, file_path: str):
         self._viz_peaks = []
@@ -932,6 +1277,7 @@ class PlayerUI(QMainWindow):
 
         def _decode():
             self.audio_player.preload_pcm(file_path)
+            self._last_viz_pos = None  # let the viz tick draw the first real frame
             self._viz_decoding = False
             if self._viz_widget:
                 self._viz_widget.set_decoding(False)
@@ -942,116 +1288,198 @@ class PlayerUI(QMainWindow):
     # Track list population
     # ------------------------------------------------------------------
 
+    def _disk_entry(self, file_path: str, fresh: bool = False) -> dict | None:
+        """Return the on-disk cache entry for file_path if the file hasn't
+        changed since it was written. With fresh=True a stale or missing
+        entry is replaced by an empty one for the current mtime."""
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            return None
+        entry = self._meta_disk.get(file_path)
+        if entry is not None and entry.get('mtime') == mtime:
+            return entry
+        if not fresh:
+            return None
+        entry = self._meta_disk[file_path] = {'mtime': mtime}
+        return entry
+
+    def _remember_meta(self, file_path: str, meta: dict):
+        self._meta_cache[file_path] = meta
+        entry = self._disk_entry(file_path, fresh=True)
+        if entry is not None:
+            entry['meta'] = meta
+            self._mark_meta_dirty()
+
+    def _meta_from_disk(self, file_path: str) -> dict | None:
+        """Promote tags cached by a previous run into _meta_cache."""
+        entry = self._disk_entry(file_path)
+        meta = entry.get('meta') if entry is not None else None
+        if meta is not None:
+            self._meta_cache[file_path] = meta
+        return meta
+
     def _get_cached_meta(self, file_path: str) -> dict:
-        if file_path not in self._meta_cache:
-            self._meta_cache[file_path] = self.audio_player.get_metadata(file_path)
+        if file_path not in self._meta_cache and self._meta_from_disk(file_path) is None:
+            self._remember_meta(file_path, self.audio_player.get_metadata(file_path))
         return self._meta_cache[file_path]
 
+    def _get_search_blob(self, file_path: str) -> str:
+        """One lowercased string per track, so filtering is a single
+        substring test instead of three lower() calls per keystroke."""
+        blob = self._search_blobs.get(file_path)
+        if blob is None:
+            meta = self._get_cached_meta(file_path)
+            # Same name the list shows; populate has already filled the cache
+            name = self._name_cache.get(file_path)
+            if name is None:
+                name = os.path.splitext(os.path.basename(file_path))[0]
+            blob = '\0'.join((name, meta.get('artist', ''), meta.get('album', ''))).lower()
+            self._search_blobs[file_path] = blob
+        return blob
+
+    def _matches_search(self, file_path: str) -> bool:
+        blob = self._get_search_blob(file_path)
+        return all(tok in blob for tok in self._search_tokens)
+
+    def _get_cached_duration(self, file_path: str) -> str:
+        duration_str = self._duration_cache.get(file_path)
+        if duration_str is None:
+            entry = self._disk_entry(file_path)
+            duration_str = entry.get('duration') if entry is not None else None
+            if duration_str is None:
+                duration_str = self.audio_player.format_time(
+                    self.audio_player.get_file_duration(file_path))
+                entry = self._disk_entry(file_path, fresh=True)
+                if entry is not None:
+                    entry['duration'] = duration_str
+                    self._mark_meta_dirty()
+            self._duration_cache[file_path] = duration_str
+        return duration_str
+
+    def _prefetch_meta(self, paths: list):
+        paths = [fp for fp in paths if fp not in self._meta_inflight]
+        if not paths:
+            return
+        self._meta_inflight.update(paths)
+        # One job per path; the last one to finish hands the whole batch
+        # back in a single signal, so the list is rebuilt once
+        batch: dict = {}
+        lock = threading.Lock()
+
+        def collect(fp, future):
+            ok = not future.cancelled() and future.exception() is None
+            with lock:
+                batch[fp] = future.result() if ok else None
+                complete = len(batch) == len(paths)
+            if complete and not self._closing:
+                self._meta_ready.emit(batch)
+
+        for fp in paths:
+            future = self._meta_exec.submit(self._read_meta_bg, fp)
+            future.add_done_callback(functools.partial(collect, fp))
+
+    def _read_meta_bg(self, file_path: str) -> dict | None:
+        """Worker thread: read one file's tags, unless the window is closing."""
+        if self._closing:
+            return None
+        return self.audio_player.get_metadata(file_path)
+
+    def _apply_prefetched_meta(self, metas: dict):
+        self._meta_inflight.difference_update(metas)
+        for fp, meta in metas.items():
+            if meta is not None and fp not in self._meta_cache:
+                self._remember_meta(fp, meta)
+        if self.sort_mode != 'folder':
+            self._request_populate()
+
     def _set_sort_mode(self, mode: str):
+        if mode == self.sort_mode:
+            return
+        # Only the old and new buttons change; the rest keep their parsed QSS
+        self._sort_buttons[self.sort_mode].setStyleSheet(self._QSS_SORT_OFF)
+        self._sort_buttons[mode].setStyleSheet(self._QSS_SORT_ON)
         self.sort_mode = mode
-        for m, btn in self._sort_buttons.items():
-            if m == mode:
-                btn.setStyleSheet(f"background: {self.ACTIVE_BLUE}; color: white; border: 1px solid {self.WIN95_DARK_GRAY};")
-            else:
-                btn.setStyleSheet(f"background: {self.WIN95_LIGHT_GRAY}; color: black; border: 1px solid {self.WIN95_DARK_GRAY};")
+        self._request_populate()
+
+    def _request_populate(self):
+        """Rebuild the tracklist now, or once it's next shown if it's hidden."""
+        if not self._tracklist_view.isVisible():
+            self._tracklist_dirty = True
+            return
         self.populate_tracklist()
 
+    def eventFilter(self, obj, event):
+        if (obj is self._tracklist_view and event.type() == QEvent.Type.Show
+                and self._tracklist_dirty):
+            self.populate_tracklist()
+        return super().eventFilter(obj, event)
+
     def populate_tracklist(self):
-        # Clear existing track rows
-        self._track_rows.clear()
-        while self._tracklist_layout.count() > 1:  # keep the trailing stretch
-            item = self._tracklist_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._tracklist_dirty = False
+        self._applied_search = self._search_text
+        self._populate_gen = None
+        self._refresh_display_names()
+        self._track_model.reset(self._display_names, self._highlighted_pi)
 
         if self.sort_mode == 'folder':
-            self._populate_by_folder()
+            gen = self._populate_by_folder()
         else:
-            self._populate_by_metadata(self.sort_mode)
+            gen = self._populate_by_metadata(self.sort_mode)
+        self._populate_gen = gen
+        self._pump_populate(gen)
+
+    def _refresh_display_names(self):
+        """Rebuild the playlist-parallel name list from the per-path cache,
+        so only newly added paths pay for basename/splitext."""
+        cache = self._name_cache
+        names = []
+        for path in self.audio_player.playlist:
+            name = cache.get(path)
+            if name is None:
+                name = cache[path] = os.path.splitext(os.path.basename(path))[0]
+            names.append(name)
+        self._display_names = names
+
+    def _pump_populate(self, gen):
+        """Build up to _POPULATE_BATCH groups, then hand control back to the
+        event loop so large libraries don't freeze the window."""
+        if gen is not self._populate_gen:
+            return  # superseded by a newer populate_tracklist() / clear_all()
+        try:
+            for _ in range(self._POPULATE_BATCH):
+                next(gen)
+        except StopIteration:
+            self._populate_gen = None
+            return
+        QTimer.singleShot(0, lambda: self._pump_populate(gen))
 
     def _build_group_section(self, group_key, label_text: str, icon: str,
                               tracks_with_idx: list, t_num_offset: int = 0):
-        """Render one collapsible group. Adds widgets directly to _tracklist_layout."""
+        """Append one collapsible group to the track-list model.
+
+        Generator — yields once the group is added so populate_tracklist()
+        can spread the build over several event-loop iterations.
+        """
         # Apply search filter
         if self._search_text:
             tracks_with_idx = [
-                (pi, fp) for pi, fp in tracks_with_idx
-                if self._search_text in os.path.splitext(os.path.basename(fp))[0].lower()
-                or self._search_text in self._get_cached_meta(fp).get('artist', '').lower()
-                or self._search_text in self._get_cached_meta(fp).get('album', '').lower()
+                (pi, fp) for pi, fp in tracks_with_idx if self._matches_search(fp)
             ]
             if not tracks_with_idx:
                 return
 
-        header_bg = "#909090"
         is_expanded = self.folder_states.get(group_key, True) if not self._search_text else True
-
-        # Header
-        header = QWidget()
-        header.setFixedHeight(24)
-        header.setStyleSheet(f"background: {header_bg};")
-        hdr_lay = QHBoxLayout(header)
-        hdr_lay.setContentsMargins(6, 0, 5, 0)
-        hdr_lay.setSpacing(4)
-
-        chevron = QLabel("▼" if is_expanded else "▶")
-        chevron.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        chevron.setStyleSheet(f"background: {header_bg}; color: black;")
-        chevron.setFixedWidth(18)
-        hdr_lay.addWidget(chevron)
-
-        folder_lbl = QLabel(f"{icon}  {label_text}")
-        folder_lbl.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        folder_lbl.setStyleSheet(f"background: {header_bg}; color: black;")
-        hdr_lay.addWidget(folder_lbl, stretch=1)
-
-        count_lbl = QLabel(f"{len(tracks_with_idx)} tracks")
-        count_lbl.setFont(QFont("Arial", 9))
-        count_lbl.setStyleSheet(f"background: {header_bg}; color: #303030;")
-        count_lbl.setFixedWidth(58)
-        count_lbl.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        hdr_lay.addWidget(count_lbl)
-
-        # Insert header before the stretch (last item)
-        insert_pos = self._tracklist_layout.count() - 1
-        self._tracklist_layout.insertWidget(insert_pos, header)
-        insert_pos += 1
-
-        # Tracks container
-        container = QWidget()
-        container.setStyleSheet(f"background: {self.TRACKLIST_BG};")
-        cont_lay = QVBoxLayout(container)
-        cont_lay.setContentsMargins(0, 0, 0, 0)
-        cont_lay.setSpacing(0)
-
-        for t_idx, (pi, file_path) in enumerate(tracks_with_idx):
-            track_name = os.path.splitext(os.path.basename(file_path))[0]
-            duration_str = self.audio_player.format_time(
-                self.audio_player.get_file_duration(file_path))
-            row = _TrackRow(pi,
-                            f"{t_num_offset + t_idx + 1:02d}.",
-                            track_name,
-                            duration_str,
-                            self.play_track_from_list,
-                            self.TRACKLIST_BG)
-            cont_lay.addWidget(row)
-            self._track_rows.append(row)
-
-        container.setVisible(is_expanded)
-        self._tracklist_layout.insertWidget(insert_pos, container)
-
-        # Click on header to collapse/expand
-        gk, tc, ch = group_key, container, chevron
-        header.mousePressEvent = lambda _e, k=gk, c=tc, v=ch: self._toggle_folder(k, c, v)
-        for child in header.findChildren(QLabel):
-            child.mousePressEvent = lambda _e, k=gk, c=tc, v=ch: self._toggle_folder(k, c, v)
+        self._track_model.append_group(_TrackGroup(
+            group_key, f"{icon}  {label_text}", tracks_with_idx, t_num_offset, is_expanded))
+        yield
 
     def _populate_by_folder(self):
         playlist_idx = 0
         for f_idx, folder in enumerate(self.audio_player.folders):
             tracks_with_idx = [(playlist_idx + i, p)
                                for i, p in enumerate(folder['tracks'])]
-            self._build_group_section(f_idx, folder['name'], "📁", tracks_with_idx)
+            yield from self._build_group_section(f_idx, folder['name'], "📁", tracks_with_idx)
             playlist_idx += len(folder['tracks'])
 
     def _populate_by_metadata(self, field: str):
@@ -1060,45 +1488,77 @@ class PlayerUI(QMainWindow):
                         'genre':  ('🎵', 'Unknown Genre')}
         icon, unknown = field_labels.get(field, ('📁', 'Unknown'))
 
-        groups: dict = {}
+        # One pass both groups the tracks and finds any without cached tags
+        meta_cache = self._meta_cache
+        groups = defaultdict(list)
+        uncached = []
         for idx, file_path in enumerate(self.audio_player.playlist):
-            key = self._get_cached_meta(file_path).get(field, '').strip() or unknown
-            groups.setdefault(key, []).append((idx, file_path))
+            meta = meta_cache.get(file_path)
+            if meta is None:
+                meta = self._meta_from_disk(file_path)
+                if meta is None:
+                    uncached.append(file_path)
+                    continue
+            groups[meta.get(field, '').strip() or unknown].append((idx, file_path))
+
+        if uncached:
+            # Read the missing tags off the GUI thread; the list is rebuilt
+            # once they arrive
+            self._prefetch_meta(uncached)
+            self._track_model.append_group(_TrackGroup(
+                None, "⏳  Reading tags…", [], 0, False))
+            return
 
         t_offset = 0
-        for group_name in sorted(groups.keys(), key=lambda s: s.lower()):
+        for _, group_name in sorted((k.lower(), k) for k in groups):
             group_key = f"{field}_{group_name}"
-            self._build_group_section(group_key, group_name, icon,
-                                      groups[group_name], t_num_offset=t_offset)
+            yield from self._build_group_section(group_key, group_name, icon,
+                                                 groups[group_name], t_num_offset=t_offset)
             t_offset += len(groups[group_name])
 
-    def _toggle_folder(self, folder_idx, tracks_container: QWidget, chevron: QLabel):
-        expanded = self.folder_states.get(folder_idx, True)
-        if expanded:
-            tracks_container.hide()
-            chevron.setText("▶")
-            self.folder_states[folder_idx] = False
+    def _on_tracklist_clicked(self, index):
+        if index.data(TrackListModel.HeaderRole):
+            self._toggle_folder(index)
         else:
-            self.folder_states[folder_idx] = True
-            self.populate_tracklist()
+            self.play_track_from_list(index.data(TrackListModel.IndexRole))
+
+    def _toggle_folder(self, header):
+        """Flip a group between expanded and collapsed. Only that group's
+        track rows are inserted or removed; nothing is repopulated."""
+        group = self._track_model.group_at(header.row())
+        if not group.tracks:
+            return  # the "Reading tags…" placeholder
+        expanded = not group.expanded
+        self.folder_states[group.key] = expanded
+        self._track_model.set_expanded(header.row(), expanded)
 
     def highlight_track(self, index: int):
-        for row in self._track_rows:
-            row.set_active(row._playlist_idx == index)
+        # Only the previously highlighted row and the new one change colour
+        self._track_model.set_active(index)
+        self._highlighted_pi = index
 
     # ------------------------------------------------------------------
     # Playback controls
     # ------------------------------------------------------------------
 
     def play_track_from_list(self, index: int):
-        if self.audio_player.play_track_at_index(index):
-            self.update_current_track_display()
+        info = self.audio_player.play_track_at_index(index)
+        if info:
+            self._render_track(info)
+
+    def _render_track(self, info):
+        """Show a TrackInfo from the player. Tags come from _meta_cache, so a
+        track that was listed or played before isn't parsed again."""
+        self.song_display.setText(f"▶ {_short_name(info.filename)}")
+        self.track_num.setText(str(info.index + 1))
+        self.highlight_track(info.index)
+        self._show_metadata(info.path)
+        self.update_album_art()
+        self._start_waveform_compute(info.path)
 
     def update_current_track_display(self):
         if self.audio_player.current_file:
-            filename = self.audio_player.get_current_filename()
-            if len(filename) > 35:
-                filename = filename[:32] + "..."
+            filename = _short_name(self.audio_player.get_current_filename())
             self.song_display.setText(f"▶ {filename}")
 
             if self.audio_player.current_track_index >= 0:
@@ -1114,7 +1574,10 @@ class PlayerUI(QMainWindow):
             self.artist_display.setText("")
             self.album_display.setText("")
             return
-        meta = self.audio_player.get_metadata(self.audio_player.current_file)
+        self._show_metadata(self.audio_player.current_file)
+
+    def _show_metadata(self, file_path: str):
+        meta = self._get_cached_meta(file_path)
         artist = meta['artist'] or 'Unknown Artist'
         self.artist_display.setText(f"\u266a {artist[:34]}")
         album = meta['album']
@@ -1130,17 +1593,68 @@ class PlayerUI(QMainWindow):
         self.album_display.setText(f"  {album_text}")
 
     def update_album_art(self):
-        if self.audio_player.current_file:
-            album_art = self.audio_player.get_album_art(self.audio_player.current_file)
-            if album_art:
-                album_art.thumbnail((280, 280), Image.Resampling.LANCZOS)
-                px = _pil_to_qpixmap(album_art)
-                self.current_album_art = px
-                self.album_art_label.setPixmap(px)
-                self.album_art_label.setText("")
-            else:
-                self.album_art_label.setPixmap(QPixmap())
-                self.album_art_label.setText("No Album Art")
+        file_path = self.audio_player.current_file
+        if not file_path:
+            return
+        try:
+            key = (file_path, os.path.getmtime(file_path))
+        except OSError:
+            key = (file_path, 0.0)
+        if key in self._art_cache:
+            self._art_cache.move_to_end(key)
+            self._show_album_art(self._art_cache[key])
+            return
+        # Tag parsing + JPEG decode + downscale can take 100ms+ on big covers
+        self._art_exec.submit(self._load_album_art_bg, key)
+
+    def _load_album_art_bg(self, key, force: bool = False):
+        """Worker thread: extract and downscale the embedded art for key[0].
+
+        Covers are identified by a digest of their raw bytes. One already
+        converted for another file (typically the rest of the album) is not
+        decoded again; the GUI thread picks it up from QPixmapCache."""
+        digest = img = None
+        try:
+            data = self.audio_player.get_album_art_data(key[0])
+            if data is not None:
+                digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+                if force or digest not in self._art_digests:
+                    img = _art_qimage(data)
+                    if img is None:
+                        digest = None
+        except Exception as e:
+            print(f"Error preparing album art: {e}")
+            digest = img = None
+        self._art_ready.emit(key, digest, img)
+
+    def _apply_album_art(self, key, digest, img):
+        px = None
+        if digest is not None:
+            px = QPixmapCache.find(digest)
+            if px is None:
+                if img is None:
+                    # Evicted since the worker checked — decode it after all
+                    self._art_digests.discard(digest)
+                    self._art_exec.submit(self._load_album_art_bg, key, True)
+                    return
+                px = QPixmap.fromImage(img)
+                QPixmapCache.insert(digest, px)
+                self._art_digests.add(digest)
+        self._art_cache[key] = px
+        if len(self._art_cache) > self._ART_CACHE_SIZE:
+            self._art_cache.popitem(last=False)
+        # The user may have moved on while the worker was busy
+        if self.audio_player.current_file == key[0]:
+            self._show_album_art(px)
+
+    def _show_album_art(self, px: QPixmap | None):
+        if px is not None:
+            self.current_album_art = px
+            self.album_art_label.setPixmap(px)
+            self.album_art_label.setText("")
+        else:
+            self.album_art_label.setPixmap(QPixmap())
+            self.album_art_label.setText("No Album Art")
 
     def play_music(self):
         if self.audio_player.play():
@@ -1152,9 +1666,7 @@ class PlayerUI(QMainWindow):
         if self.audio_player.pause():
             filename = self.audio_player.get_current_filename()
             if filename:
-                if len(filename) > 35:
-                    filename = filename[:32] + "..."
-                self.song_display.setText(f"II {filename}")
+                self.song_display.setText(f"II {_short_name(filename)}")
 
     def stop_music(self):
         if self._radio_playing:
@@ -1163,26 +1675,26 @@ class PlayerUI(QMainWindow):
         self.audio_player.stop()
         filename = self.audio_player.get_current_filename()
         if filename:
-            if len(filename) > 35:
-                filename = filename[:32] + "..."
-            self.song_display.setText(f"■ {filename}")
+            self.song_display.setText(f"■ {_short_name(filename)}")
 
     def previous_track(self):
-        if self.audio_player.play_previous():
-            self.update_current_track_display()
+        info = self.audio_player.play_previous()
+        if info:
+            self._render_track(info)
         else:
             self.song_display.setText("⏮ No previous track")
 
     def next_track(self):
-        if self.audio_player.play_next():
-            self.update_current_track_display()
+        info = self.audio_player.play_next()
+        if info:
+            self._render_track(info)
         else:
             self.song_display.setText("⏭ No next track")
 
     def toggle_shuffle(self):
         active = self.audio_player.toggle_shuffle()
         if active:
-            self.shuffle_btn.setStyleSheet(f"background: {self.ACTIVE_BLUE}; color: white;")
+            self.shuffle_btn.setStyleSheet(self._QSS_TOGGLE_ON)
             self.shuffle_btn.setText("🔀 On")
         else:
             self.shuffle_btn.setStyleSheet("")
@@ -1192,12 +1704,13 @@ class PlayerUI(QMainWindow):
         mode = self.audio_player.cycle_repeat()
         labels = {
             0: ("🔁 Off", ""),
-            1: ("🔁 All", f"background: {self.ACTIVE_BLUE}; color: white;"),
-            2: ("🔂 One", f"background: {self.ACTIVE_BLUE}; color: white;"),
+            1: ("🔁 All", self._QSS_TOGGLE_ON),
+            2: ("🔂 One", self._QSS_TOGGLE_ON),
         }
         text, style = labels[mode]
         self.repeat_btn.setText(text)
-        self.repeat_btn.setStyleSheet(style)
+        if style != self.repeat_btn.styleSheet():  # All -> One keeps the same style
+            self.repeat_btn.setStyleSheet(style)
 
     # ------------------------------------------------------------------
     # Seek
@@ -1216,54 +1729,91 @@ class PlayerUI(QMainWindow):
             target_seconds = (self._seek_pending / 100.0) * total
             self.audio_player.seek(target_seconds)
         self.seeking = False
+        self._last_seek_tick = -1  # slider was moved by hand; resync next tick
 
     def change_volume(self, value: int):
         self.audio_player.set_volume(value / 100)
         self.volume_label.setText(f"{value}%")
 
     # ------------------------------------------------------------------
-    # 100ms timer tick
+    # Timer ticks
     # ------------------------------------------------------------------
 
     def _update_tick(self):
         if self._radio_playing:
-            self._draw_waveform(0.0)
             return
 
         if self.audio_player.current_file:
             current_time = self.audio_player.get_position()
             total_time   = self.audio_player.get_duration()
 
-            self.time_display.setText(
-                f"{self.audio_player.format_time(current_time)} / "
-                f"{self.audio_player.format_time(total_time)}"
-            )
-
-            if not self.seeking:
-                progress = int(current_time / total_time * 100) if total_time > 0 else 0
-                self.seek_slider.blockSignals(True)
-                self.seek_slider.setValue(progress)
-                self.seek_slider.blockSignals(False)
-
-            self._draw_waveform(current_time)
-
-            if self.audio_player.is_playing and current_time >= total_time and total_time > 0:
-                if self.audio_player.play_next():
-                    self.update_current_track_display()
+            if total_time <= 0:
+                # Duration unknown (e.g. unreadable file) — position is pinned
+                # at 0 too, so skip the formatting and division.
+                self._set_time_text("0:00 / 0:00")
+                if not self.seeking:
+                    self._set_seek_value(0)
+            else:
+                # The readout only has whole seconds, so most ticks can skip
+                # formatting it at all
+                secs = (int(current_time), int(total_time))
+                if secs != self._last_time_secs:
+                    self._set_time_text(
+                        f"{self.audio_player.format_time(current_time)} / "
+                        f"{self.audio_player.format_time(total_time)}"
+                    )
+                    self._last_time_secs = secs
+                if not self.seeking:
+                    self._set_seek_value(int(current_time / total_time * 100))
+
+            if self.audio_player.is_playing and total_time > 0 and current_time >= total_time:
+                info = self.audio_player.play_next()
+                if info:
+                    self._render_track(info)
                 else:
                     self.stop_music()
 
             # Update Save Art to Tags menu item enabled state
             can_save = (self._pending_art_image is not None and
                         self.audio_player.current_file is not None)
-            self._art_save_action.setEnabled(can_save)
+            if can_save != self._art_save_action.isEnabled():
+                self._art_save_action.setEnabled(can_save)
         else:
-            self.time_display.setText("0:00 / 0:00")
+            self._set_time_text("0:00 / 0:00")
             if not self.seeking:
-                self.seek_slider.blockSignals(True)
-                self.seek_slider.setValue(0)
-                self.seek_slider.blockSignals(False)
-            self._draw_waveform(0.0)
+                self._set_seek_value(0)
+
+    def _viz_tick(self):
+        viz = self._viz_widget
+        # Nothing to draw into: hidden, clipped away, or the window is minimized
+        if (viz is None or not viz.isVisible() or self.isMinimized()
+                or viz.visibleRegion().isEmpty()):
+            return
+        if self._radio_playing or not self.audio_player.current_file:
+            pos = 0.0
+        else:
+            pos = self.audio_player.get_position()
+        # Paused, stopped or idle: the frame can't change until the position does
+        if (pos == self._last_viz_pos and not self.audio_player.is_playing
+                and not self._viz_decoding):
+            return
+        self._last_viz_pos = pos
+        self._draw_waveform(pos)
+
+    def _set_time_text(self, text: str):
+        """Set the LCD time readout, skipping the repaint if unchanged."""
+        self._last_time_secs = None  # _update_tick re-sets it when it owns the text
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.time_display.setText(text)
+
+    def _set_seek_value(self, value: int):
+        """Move the seek slider without emitting valueChanged, if it moved."""
+        if value != self._last_seek_tick:
+            self._last_seek_tick = value
+            self.seek_slider.blockSignals(True)
+            self.seek_slider.setValue(value)
+            self.seek_slider.blockSignals(False)
 
     # Kept for API compatibility with main.py
     def run(self):
@@ -1274,13 +1824,20 @@ class PlayerUI(QMainWindow):
     # ------------------------------------------------------------------
 
     def _bind_keyboard_shortcuts(self):
-        QShortcut(QKeySequence(Qt.Key.Key_Space),  self).activated.connect(self._kb_play_pause)
-        QShortcut(QKeySequence(Qt.Key.Key_S),      self).activated.connect(self.stop_music)
-        QShortcut(QKeySequence(Qt.Key.Key_Escape), self).activated.connect(self.stop_music)
-        QShortcut(QKeySequence(Qt.Key.Key_Left),   self).activated.connect(self.previous_track)
-        QShortcut(QKeySequence(Qt.Key.Key_Right),  self).activated.connect(self.next_track)
-        QShortcut(QKeySequence(Qt.Key.Key_Up),     self).activated.connect(self._kb_volume_up)
-        QShortcut(QKeySequence(Qt.Key.Key_Down),   self).activated.connect(self._kb_volume_down)
+        # Shortcuts rather than a keyPressEvent table: shortcuts are matched
+        # before the focused widget sees the key, so a focused button or
+        # slider can't swallow Space or the arrows.
+        bindings = {
+            Qt.Key.Key_Space:  self._kb_play_pause,
+            Qt.Key.Key_S:      self.stop_music,
+            Qt.Key.Key_Escape: self.stop_music,
+            Qt.Key.Key_Left:   self.previous_track,
+            Qt.Key.Key_Right:  self.next_track,
+            Qt.Key.Key_Up:     self._kb_volume_up,
+            Qt.Key.Key_Down:   self._kb_volume_down,
+        }
+        for key, slot in bindings.items():
+            QShortcut(QKeySequence(key), self).activated.connect(slot)
 
     def _kb_play_pause(self):
         if self.audio_player.is_playing:
@@ -1306,24 +1863,29 @@ class PlayerUI(QMainWindow):
 
     def dropEvent(self, event):
         paths = [url.toLocalFile() for url in event.mimeData().urls()]
-        supported = {'.mp3', '.m4a', '.mp4', '.aac', '.wma', '.wav', '.flac'}
         changed = False
         groups: dict = {}
 
         for path in paths:
-            if os.path.isdir(path):
+            try:
+                mode = os.stat(path).st_mode  # one stat instead of isdir + isfile
+            except OSError:
+                continue
+            if stat.S_ISDIR(mode):
                 if self.audio_player.add_folder(path):
                     changed = True
-            elif os.path.isfile(path) and os.path.splitext(path)[1].lower() in supported:
-                parent = os.path.basename(os.path.dirname(path))
-                groups.setdefault(parent, []).append(path)
+            elif stat.S_ISREG(mode):
+                _, dot, ext = path.rpartition('.')
+                if dot and ext.lower() in _SUPPORTED_EXTS:
+                    parent = os.path.basename(os.path.dirname(path))
+                    groups.setdefault(parent, []).append(path)
 
         for group_name, files in groups.items():
             if self.audio_player.add_files_group(group_name, files):
                 changed = True
 
         if changed:
-            self.populate_tracklist()
+            self._request_populate()
 
     # ------------------------------------------------------------------
     # Playlist
@@ -1338,7 +1900,7 @@ class PlayerUI(QMainWindow):
             if self.audio_player.add_folder(folder_path):
                 self._save_config({'last_folder': folder_path})
                 self.default_music_folder = folder_path
-                self.populate_tracklist()
+                self._request_populate()
                 if self.audio_player.current_track_index < 0 and self.audio_player.playlist:
                     self.audio_player.load_file(self.audio_player.playlist[0])
                     self.audio_player.current_track_index = 0
@@ -1361,32 +1923,35 @@ class PlayerUI(QMainWindow):
         )
         if file_path:
             if self.audio_player.load_playlist_m3u(file_path):
-                self.populate_tracklist()
-                if self.audio_player.playlist:
-                    self.audio_player.load_file(self.audio_player.playlist[0])
-                    self.audio_player.current_track_index = 0
-                    self.update_current_track_display()
+                self._request_populate()
+                # Let the first rows paint before loading/decoding track 1
+                QTimer.singleShot(0, self._finish_playlist_load)
+
+    def _finish_playlist_load(self):
+        if self.audio_player.playlist:
+            self.audio_player.load_file(self.audio_player.playlist[0])
+            self.audio_player.current_track_index = 0
+            self.update_current_track_display()
 
     def clear_all(self):
         if self._radio_playing:
             self._stop_radio()
         self.audio_player.reset()
 
-        self._track_rows.clear()
-        while self._tracklist_layout.count() > 1:
-            item = self._tracklist_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._populate_gen = None
+        self._tracklist_dirty = False
+        self._display_names = []
+        self._name_cache = {}
+        self._highlighted_pi = None
+        self._track_model.reset(self._display_names)
 
         self.song_display.setText("No file loaded")
         self.track_num.setText("1")
-        self.time_display.setText("0:00 / 0:00")
+        self._set_time_text("0:00 / 0:00")
         self.artist_display.setText("")
         self.album_display.setText("")
 
-        self.seek_slider.blockSignals(True)
-        self.seek_slider.setValue(0)
-        self.seek_slider.blockSignals(False)
+        self._set_seek_value(0)
 
         self._pending_art_image = None
         self.current_album_art  = None
@@ -1399,10 +1964,12 @@ class PlayerUI(QMainWindow):
         self.repeat_btn.setText("🔁 Off")
 
         self._search_text = ''
+        self._search_tokens = []
         if self._search_entry:
             self._search_entry.clear()
         if self._search_frame and self._search_frame.isVisible():
             self._toggle_search()
+        self._search_timer.stop()
 
         self._viz_peaks    = []
         self._viz_decoding = False
@@ -1411,12 +1978,12 @@ class PlayerUI(QMainWindow):
 
         self.folder_states = {}
         self._meta_cache   = {}
+        self._duration_cache = {}
+        self._search_blobs = {}
+        if self.sort_mode != 'folder':
+            self._sort_buttons[self.sort_mode].setStyleSheet(self._QSS_SORT_OFF)
+            self._sort_buttons['folder'].setStyleSheet(self._QSS_SORT_ON)
         self.sort_mode     = 'folder'
-        for m, btn in self._sort_buttons.items():
-            if m == 'folder':
-                btn.setStyleSheet(f"background: {self.ACTIVE_BLUE}; color: white; border: 1px solid {self.WIN95_DARK_GRAY};")
-            else:
-                btn.setStyleSheet(f"background: {self.WIN95_LIGHT_GRAY}; color: black; border: 1px solid {self.WIN95_DARK_GRAY};")
 
     # ------------------------------------------------------------------
     # File menu actions
@@ -1429,7 +1996,7 @@ class PlayerUI(QMainWindow):
         )
         if paths:
             self.audio_player.add_files_to_playlist(list(paths))
-            self.populate_tracklist()
+            self._request_populate()
             if self.audio_player.current_track_index < 0:
                 self.audio_player.load_file(self.audio_player.playlist[0])
                 self.audio_player.current_track_index = 0
@@ -1445,38 +2012,55 @@ class PlayerUI(QMainWindow):
             "Image Files (*.jpg *.jpeg *.png *.bmp *.webp);;All Files (*.*)"
         )
         if path:
-            try:
-                img = Image.open(path)
-                self._pending_art_image = img.copy()
-                self._display_art(img)
-            except Exception as e:
-                print(f"Error loading image: {e}")
+            self._art_exec.submit(self._load_art_file_bg, path)
+
+    def _load_art_file_bg(self, path):
+        """Worker thread: read and downscale a user-picked image."""
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            print(f"Error loading image: {e}")
+            return
+        img = _art_qimage(raw)
+        if img is not None:
+            self._file_art_ready.emit(raw, img)
+
+    def _apply_file_art(self, raw, img):
+        self._pending_art_image = (raw, _image_mime(raw))
+        self._display_art(img)
 
     def _art_find_online(self):
-        if not self.audio_player.current_file:
+        file_path = self.audio_player.current_file
+        if not file_path:
             return
-        meta  = self.audio_player.get_metadata(self.audio_player.current_file)
+        meta  = self.audio_player.get_metadata(file_path)
         title = os.path.splitext(self.audio_player.get_current_filename())[0]
         self.song_display.setText("Searching for art...")
-        QApplication.processEvents()
-        img = self.audio_player.fetch_album_art_online(
-            artist=meta.get('artist', ''),
-            album=meta.get('album', ''),
-            title=title
-        )
-        filename = self.audio_player.get_current_filename() or ''
-        if len(filename) > 35:
-            filename = filename[:32] + '...'
-        if img:
-            self._pending_art_image = img.copy()
+        self._net_exec.submit(self._fetch_online_art_bg, file_path,
+                              meta.get('artist', ''), meta.get('album', ''), title)
+
+    def _fetch_online_art_bg(self, file_path, artist, album, title):
+        """Worker thread: the iTunes round-trip can take several seconds, and
+        the cover is decoded and downscaled here too."""
+        raw = self.audio_player.fetch_album_art_online(
+            artist=artist, album=album, title=title)
+        img = _art_qimage(raw) if raw else None
+        self._online_art_ready.emit(file_path, (raw, img) if img is not None else None)
+
+    def _apply_online_art(self, file_path, result):
+        if self.audio_player.current_file != file_path:
+            return  # track changed while the search was in flight
+        if result:
+            raw, img = result
+            self._pending_art_image = (raw, _image_mime(raw))
             self._display_art(img)
             self.song_display.setText("Art found — use File > Save Art to Tags")
         else:
             self.song_display.setText("No art found online")
 
-    def _display_art(self, img: Image.Image):
-        img.thumbnail((280, 280), Image.Resampling.LANCZOS)
-        px = _pil_to_qpixmap(img)
+    def _display_art(self, img: QImage):
+        px = QPixmap.fromImage(img)
         self.current_album_art = px
         self.album_art_label.setPixmap(px)
         self.album_art_label.setText("")
@@ -1484,9 +2068,15 @@ class PlayerUI(QMainWindow):
     def _art_save_to_tags(self):
         if not self._pending_art_image or not self.audio_player.current_file:
             return
-        buf = io.BytesIO()
-        self._pending_art_image.convert('RGB').save(buf, format='JPEG', quality=90)
-        if self.audio_player.embed_album_art(self.audio_player.current_file, buf.getvalue()):
+        raw, mime = self._pending_art_image
+        if mime == 'image/jpeg':
+            data = raw  # already JPEG — embed as-is, no generational loss
+        else:
+            from PIL import Image
+            buf = io.BytesIO()
+            Image.open(io.BytesIO(raw)).convert('RGB').save(buf, format='JPEG', quality=90)
+            data = buf.getvalue()
+        if self.audio_player.embed_album_art(self.audio_player.current_file, data):
             self._pending_art_image = None
             self.song_display.setText("Art saved to tags")
 
@@ -1508,10 +2098,76 @@ class PlayerUI(QMainWindow):
             return {}
 
     def _save_config(self, data: dict):
+        # Re-saving an unchanged value (e.g. reopening the same folder) isn't
+        # a write. A value that *is* the stored object (the favourites list)
+        # may have been mutated in place, so it always counts as a change.
+        if all(k in self._config and self._config[k] is not v and self._config[k] == v
+               for k, v in data.items()):
+            return
+        self._config.update(data)
+        self._config_flush_timer.start(1000)
+
+    def _flush_config(self):
+        """Write self._config to disk atomically (temp file + os.replace)."""
+        self._config_flush_timer.stop()
+        tmp_path = CONFIG_PATH + '.tmp'
         try:
-            existing = self._load_config()
-            existing.update(data)
-            with open(CONFIG_PATH, 'w') as f:
-                json.dump(existing, f, indent=2)
+            with open(tmp_path, 'w') as f:
+                json.dump(self._config, f, indent=2)
+            os.replace(tmp_path, CONFIG_PATH)
         except Exception as e:
             print(f"Config save error: {e}")
+
+    def _load_meta_cache(self) -> dict:
+        try:
+            with open(META_CACHE_PATH, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _mark_meta_dirty(self):
+        # Not restarted on every call: durations trickle in as rows are
+        # painted, and a steady scroll shouldn't postpone the write forever
+        if not self._meta_flush_timer.isActive():
+            self._meta_flush_timer.start(5000)
+
+    def _meta_snapshot(self) -> dict | None:
+        """Prune _meta_disk to the current playlist and return a copy that a
+        worker can dump while the GUI thread keeps filling in entries."""
+        self._meta_flush_timer.stop()
+        playlist = self.audio_player.playlist
+        if not playlist:
+            return None  # nothing loaded (e.g. after Clear All) — keep the file
+        disk = self._meta_disk
+        self._meta_disk = {fp: disk[fp] for fp in playlist if fp in disk}
+        return {fp: dict(entry) for fp, entry in self._meta_disk.items()}
+
+    def _save_meta_cache(self):
+        snapshot = self._meta_snapshot()
+        if snapshot is not None:
+            self._meta_write_exec.submit(self._write_meta_cache, snapshot)
+
+    def _write_meta_cache(self, snapshot: dict):
+        """Write snapshot to disk atomically (temp file + os.replace)."""
+        tmp_path = META_CACHE_PATH + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, META_CACHE_PATH)
+        except Exception as e:
+            print(f"Metadata cache save error: {e}")
+
+    def closeEvent(self, event):
+        # Drop queued tag reads so interpreter exit doesn't wait on them
+        self._closing = True
+        self._meta_exec.shutdown(wait=False, cancel_futures=True)
+        if self._config_flush_timer.isActive():
+            self._flush_config()
+        # Let any earlier background write finish first, so it can't land on
+        # top of the newer snapshot written below
+        self._meta_write_exec.shutdown(wait=True)
+        if self._meta_flush_timer.isActive():
+            snapshot = self._meta_snapshot()
+            if snapshot is not None:
+                self._write_meta_cache(snapshot)  # the process is about to exit
+        super().closeEvent(event)